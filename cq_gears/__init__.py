@@ -1,22 +1,38 @@
 from . import core, api, rack, hobbing, parametric_gear
-from . import geometry, cq_bridge
+from . import geometry, cq_bridge, cache, parallel
 from . import plotting, visualization
 
-from .core import GearData, Gear, GearList, compute_gear_data
+from .core import (
+    GearData,
+    GearDataBatch,
+    Gear,
+    GearList,
+    compute_gear_data,
+    compute_gear_data_batch,
+    stack_gear_data,
+)
 from .api import (
     initialize_gears,
     create_racks,
     cut_gears,
     build_parametric_gear,
+    build_many,
+    cut_many,
 )
+from .parametric_gear import compute_tooth_points_batch
+from .cache import SolidCache
+from .parallel import JobError
 from .visualization import create_video
 
 __all__ = [
     "core", "api", "rack", "hobbing", "parametric_gear",
-    "geometry", "cq_bridge",
+    "geometry", "cq_bridge", "cache", "parallel",
     "plotting", "visualization",
-    "GearData", "Gear", "GearList",
-    "compute_gear_data",
+    "GearData", "GearDataBatch", "Gear", "GearList",
+    "compute_gear_data", "compute_gear_data_batch", "stack_gear_data",
+    "compute_tooth_points_batch",
     "initialize_gears", "create_racks", "cut_gears", "build_parametric_gear",
+    "build_many", "cut_many",
+    "SolidCache", "JobError",
     "create_video",
 ]
@@ -1,10 +1,28 @@
 import cadquery as cq
+import tempfile
+import time
+from pathlib import Path
 from typing import Literal
+from OCP.gp import gp_Trsf
 
+from . import cq_bridge
 from .core import GearData, Gear, GearList, find_compatible_groups
+from .cache import LRUMemo, SolidCache, cache_key
+from .parallel import JobError, ProgressCallback, run_jobs
 from .rack import create_rack_cutter_for_group
-from .hobbing import simulate_gear_cutting
-from .parametric_gear import parametric_gear_workplane
+from .hobbing import (
+    HobbingMode,
+    rack_placements,
+    rack_transforms,
+    simulate_gear_cutting,
+)
+from .parametric_gear import (
+    FlankCurves,
+    GearConstruction,
+    _check_flank_sampling,
+    parametric_gear_workplane,
+)
+from .visualization import RenderQueue, RigidMesh
 
 
 def initialize_gears(gear_data_list: list[GearData]) -> GearList:
@@ -16,10 +34,13 @@ def initialize_gears(gear_data_list: list[GearData]) -> GearList:
     return GearList(gear_list, groups)
 
 
-def create_racks(gear_list: GearList) -> None:
+def create_racks(gear_list: GearList, cache: SolidCache | None = None) -> None:
+    # racks are memoized in-process; cache also keeps them on disk
+    gear_data_list: list[GearData] = [gear.data for gear in gear_list.gears]
     for group in gear_list.groups:
-        gear_data_list: list[GearData] = [gear.data for gear in gear_list.gears]
-        rack: cq.Workplane = create_rack_cutter_for_group(gear_data_list, group)
+        rack: cq.Workplane = create_rack_cutter_for_group(
+            gear_data_list, group, cache
+        )
         for id in group:
             gear_list.gears[id].rack = rack
 
@@ -28,20 +49,318 @@ def cut_gears(
     gear_list: GearList,
     num_cut_positions: int,
     visualize: Literal[None, "show", "step", "img"],
-) -> None:
-    for i, gear in enumerate(gear_list.gears):
-        gear_list.gears[i].workplane = simulate_gear_cutting(
-            gear, num_cut_positions, visualize, i
+    mode: HobbingMode = "sequential",
+    checkpoint_every: int | None = None,
+    resume: bool = False,
+    parallel: bool = False,
+    max_workers: int | None = None,
+    render_workers: int = 0,
+    video_length: float | None = None,
+) -> list[float]:
+    # returns the time in seconds spent cutting each gear. With parallel the
+    # gears are cut in a process pool (see cut_many), which does not support
+    # visualize="show". render_workers > 0 renders img frames in that many
+    # processes while the cutting goes on. video_length (in seconds) streams
+    # the img frames of each gear into output/video/<index>.mp4 instead of
+    # writing PNG files.
+    durations: list[float] = []
+    if parallel:
+        cut: list[tuple[bytes, float] | JobError] = _cut_in_pool(
+            gear_list,
+            num_cut_positions,
+            visualize,
+            max_workers,
+            None,
+            mode,
+            checkpoint_every,
+            resume,
+            video_length,
         )
+        for i, outcome in enumerate(cut):
+            if isinstance(outcome, JobError):
+                raise RuntimeError(f"Cutting gear {i} failed:\n{outcome.message}")
+            brep, duration = outcome
+            gear_list.gears[i].workplane = cq_bridge.workplane_from_brep(brep)
+            durations.append(duration)
+        return durations
+
+    render_queue: RenderQueue | None = None
+    if visualize == "img" and render_workers > 0:
+        render_queue = RenderQueue(render_workers)
+
+    # gears of a group that share pitch, tooth count and pitch diameter also
+    # share the rack positions
+    placements: dict[tuple[float, int, float], list[gp_Trsf]] = {}
+    # img frames tessellate the rack of each group once
+    rack_meshes: dict[int, RigidMesh] = {}
+    try:
+        for i, gear in enumerate(gear_list.gears):
+            start: float = time.perf_counter()
+            key: tuple[float, int, float] = (gear.data.p, gear.data.z, gear.data.d)
+            if key not in placements:
+                placements[key] = rack_placements(
+                    rack_transforms(gear.data, num_cut_positions, mode)
+                )
+            if (
+                visualize == "img"
+                and gear.rack is not None
+                and id(gear.rack) not in rack_meshes
+            ):
+                rack_meshes[id(gear.rack)] = RigidMesh(gear.rack)
+            gear_list.gears[i].workplane = simulate_gear_cutting(
+                gear,
+                num_cut_positions,
+                visualize,
+                i,
+                mode,
+                checkpoint_every,
+                resume,
+                placements[key],
+                render_queue,
+                rack_meshes.get(id(gear.rack)),
+                video_length,
+            )
+            durations.append(time.perf_counter() - start)
+    finally:
+        if render_queue is not None:
+            render_queue.close()
+    return durations
+
 
 def build_parametric_gear(
         geardata: GearData,
-        n_spline_points: int,
+        n_spline_points: int | None = None,
+        cache: SolidCache | None = None,
+        construction: GearConstruction = "union",
+        tolerance: float | None = None,
+        flank_curves: FlankCurves = "interpolate",
 ) -> Gear:
-    if n_spline_points < 3:
-        raise ValueError(f"n_spline_points must be greater than 3. Instead got {n_spline_points}")
+    # tolerance (in mm) samples the flanks adaptively instead of with a fixed
+    # number of spline points, with flank_curves="fit" it bounds the deviation
+    # of the fitted B-spline flanks
+    _check_flank_sampling(n_spline_points, tolerance)
+
+    key: str | None = None
+    if cache is not None:
+        key = cache_key(
+            "parametric_gear",
+            geardata=geardata,
+            n_spline_points=n_spline_points,
+            construction=construction,
+            tolerance=tolerance,
+            flank_curves=flank_curves,
+        )
+        cached: cq.Workplane | None = cache.get(key)
+        if cached is not None:
+            return Gear(geardata, None, cached)
 
-    gear_workplane: cq.Workplane = parametric_gear_workplane(geardata, n_spline_points)
+    gear_workplane: cq.Workplane = parametric_gear_workplane(
+        geardata, n_spline_points, construction, tolerance, flank_curves
+    )
+    if cache is not None and key is not None:
+        cache.put(key, gear_workplane)
     gear: Gear = Gear(geardata, None, gear_workplane)
 
     return gear
+
+
+def _build_job(
+    geardata: GearData,
+    n_spline_points: int | None,
+    construction: GearConstruction,
+    tolerance: float | None,
+    flank_curves: FlankCurves,
+) -> bytes:
+    return cq_bridge.workplane_to_brep(
+        parametric_gear_workplane(
+            geardata, n_spline_points, construction, tolerance, flank_curves
+        )
+    )
+
+
+def build_many(
+    gear_data_list: list[GearData],
+    n_spline_points: int | None = None,
+    max_workers: int | None = None,
+    progress: ProgressCallback | None = None,
+    cache: SolidCache | None = None,
+    construction: GearConstruction = "union",
+    tolerance: float | None = None,
+    flank_curves: FlankCurves = "interpolate",
+) -> list[Gear | JobError]:
+    _check_flank_sampling(n_spline_points, tolerance)
+
+    results: list[Gear | JobError] = [None] * len(gear_data_list)  # type: ignore
+    keys: list[str | None] = [None] * len(gear_data_list)
+    pending: list[int] = []
+    for i, geardata in enumerate(gear_data_list):
+        if cache is not None:
+            keys[i] = cache_key(
+                "parametric_gear",
+                geardata=geardata,
+                n_spline_points=n_spline_points,
+                construction=construction,
+                tolerance=tolerance,
+                flank_curves=flank_curves,
+            )
+            cached: cq.Workplane | None = cache.get(keys[i])  # type: ignore
+            if cached is not None:
+                results[i] = Gear(geardata, None, cached)
+                continue
+        pending.append(i)
+
+    n_cached: int = len(gear_data_list) - len(pending)
+
+    def report(completed: int, total: int) -> None:
+        if progress is not None:
+            progress(n_cached + completed, n_cached + total)
+
+    # the cache hits count as completed, also when no job is left to run
+    if n_cached > 0:
+        report(0, len(pending))
+
+    built: list[bytes | JobError] = run_jobs(
+        _build_job,
+        [
+            (gear_data_list[i], n_spline_points, construction, tolerance, flank_curves)
+            for i in pending
+        ],
+        [gear_data_list[i] for i in pending],
+        max_workers,
+        report,
+    )
+
+    for i, outcome in zip(pending, built):
+        if isinstance(outcome, JobError):
+            outcome.index = i
+            results[i] = outcome
+            continue
+        workplane: cq.Workplane = cq_bridge.workplane_from_brep(outcome)
+        if cache is not None:
+            cache.put(keys[i], workplane)  # type: ignore
+        results[i] = Gear(gear_data_list[i], None, workplane)
+
+    return results
+
+
+# racks loaded by a worker process, keyed by the BREP file of their group, so
+# that each worker reads every rack once
+_worker_racks: LRUMemo = LRUMemo(maxsize=8)
+
+
+def _cut_job(
+    geardata: GearData,
+    rack_path: str,
+    num_cut_positions: int,
+    visualize: Literal[None, "step", "img"],
+    gear_index: int,
+    mode: HobbingMode,
+    checkpoint_every: int | None,
+    resume: bool,
+    video_length: float | None,
+) -> tuple[bytes, float]:
+    start: float = time.perf_counter()
+    rack: cq.Workplane = _worker_racks.get_or_compute(
+        rack_path,
+        lambda: cq_bridge.workplane_from_brep(Path(rack_path).read_bytes()),
+    )
+    gear: Gear = Gear(geardata, rack, cq.Workplane())
+    brep: bytes = cq_bridge.workplane_to_brep(
+        simulate_gear_cutting(
+            gear,
+            num_cut_positions,
+            visualize,
+            gear_index,
+            mode,
+            checkpoint_every,
+            resume,
+            video_length=video_length,
+        )
+    )
+    return brep, time.perf_counter() - start
+
+
+def _cut_in_pool(
+    gear_list: GearList,
+    num_cut_positions: int,
+    visualize: Literal[None, "show", "step", "img"],
+    max_workers: int | None,
+    progress: ProgressCallback | None,
+    mode: HobbingMode,
+    checkpoint_every: int | None,
+    resume: bool,
+    video_length: float | None,
+) -> list[tuple[bytes, float] | JobError]:
+    if visualize == "show":
+        raise ValueError("visualize='show' is not supported in worker processes")
+
+    with tempfile.TemporaryDirectory(prefix="cq_gears_racks_") as rack_dir:
+        # every rack (one per compatibility group) is written once and the
+        # jobs only receive its path
+        rack_paths: dict[int, str] = {}
+        job_args: list[tuple] = []
+        for i, gear in enumerate(gear_list.gears):
+            if gear.rack is None:
+                raise ValueError(
+                    f"Could not cut gear {i}. No rack found in gear (None value)"
+                )
+            if id(gear.rack) not in rack_paths:
+                rack_path: Path = Path(rack_dir) / f"rack_{len(rack_paths)}.brep"
+                rack_path.write_bytes(cq_bridge.workplane_to_brep(gear.rack))
+                rack_paths[id(gear.rack)] = str(rack_path)
+            job_args.append(
+                (
+                    gear.data,
+                    rack_paths[id(gear.rack)],
+                    num_cut_positions,
+                    visualize,
+                    i,
+                    mode,
+                    checkpoint_every,
+                    resume,
+                    video_length,
+                )
+            )
+
+        return run_jobs(
+            _cut_job,
+            job_args,
+            [gear.data for gear in gear_list.gears],
+            max_workers,
+            progress,
+        )
+
+
+def cut_many(
+    gear_list: GearList,
+    num_cut_positions: int,
+    visualize: Literal[None, "step", "img"] = None,
+    max_workers: int | None = None,
+    progress: ProgressCallback | None = None,
+    mode: HobbingMode = "sequential",
+    checkpoint_every: int | None = None,
+    resume: bool = False,
+    video_length: float | None = None,
+) -> list[Gear | JobError]:
+    cut: list[tuple[bytes, float] | JobError] = _cut_in_pool(
+        gear_list,
+        num_cut_positions,
+        visualize,
+        max_workers,
+        progress,
+        mode,
+        checkpoint_every,
+        resume,
+        video_length,
+    )
+
+    results: list[Gear | JobError] = []
+    for gear, outcome in zip(gear_list.gears, cut):
+        if isinstance(outcome, JobError):
+            results.append(outcome)
+        else:
+            results.append(
+                Gear(gear.data, gear.rack, cq_bridge.workplane_from_brep(outcome[0]))
+            )
+
+    return results
@@ -0,0 +1,197 @@
+import cadquery as cq
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from importlib import metadata
+from pathlib import Path
+from typing import Callable, Hashable, TypeVar
+
+from . import cq_bridge
+
+T = TypeVar("T")
+
+
+def _library_version() -> str:
+    try:
+        return metadata.version("cq_gears")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _canonical(value: object) -> object:
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _canonical(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        # repr round-trips exactly, so equal inputs always hash equal
+        return repr(float(value))
+    if hasattr(value, "item"):  # numpy scalars
+        return _canonical(value.item())
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    raise TypeError(f"Cannot build a cache key from {type(value).__name__}")
+
+
+def cache_key(kind: str, **params: object) -> str:
+    payload: dict[str, object] = {
+        "kind": kind,
+        "version": _library_version(),
+        "params": {name: _canonical(value) for name, value in params.items()},
+    }
+    encoded: bytes = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class SolidCache:
+    """
+    Content-addressed on-disk cache of BREP solids with LRU eviction.
+
+    Entries are stored as ``<key>.brep`` in ``cache_dir``. Every hit refreshes
+    the file modification time, and once the directory grows beyond
+    ``max_bytes`` the least recently used entries are deleted.
+
+    Args:
+        cache_dir: Directory holding the cached BREP files
+        max_bytes: Upper bound for the total size of all cached files
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 1024**3) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive. Instead got {max_bytes}")
+        self.cache_dir: Path = Path(cache_dir)
+        self.max_bytes: int = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.brep"
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def get(self, key: str) -> cq.Workplane | None:
+        path: Path = self._path(key)
+        try:
+            data: bytes = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return cq_bridge.workplane_from_brep(data)
+
+    def put(self, key: str, workplane: cq.Workplane) -> None:
+        data: bytes = cq_bridge.workplane_to_brep(workplane)
+        path: Path = self._path(key)
+        tmp_path: Path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def invalidate(self, key: str | None = None) -> None:
+        """
+        Remove a single entry, or every entry when key is None.
+        """
+        paths: list[Path] = [self._path(key)] if key is not None else self._entries()
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def size_bytes(self) -> int:
+        total: int = 0
+        for path in self._entries():
+            try:
+                total += path.stat().st_size
+            except FileNotFoundError:
+                pass
+        return total
+
+    def _entries(self) -> list[Path]:
+        return list(self.cache_dir.glob("*.brep"))
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self._entries():
+            try:
+                stat: os.stat_result = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total: int = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+@dataclass
+class MemoStats:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class LRUMemo:
+    """
+    Bounded, thread-safe in-process LRU memo.
+
+    Values are computed outside the lock, so two threads missing on the same
+    key may both compute it; the last result wins and both are returned.
+
+    Args:
+        maxsize: Maximum number of entries kept before the least recently used
+            one is dropped
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive. Instead got {maxsize}")
+        self.maxsize: int = maxsize
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]  # type: ignore
+            self._misses += 1
+
+        value: T = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def stats(self) -> MemoStats:
+        with self._lock:
+            return MemoStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
@@ -1,6 +1,6 @@
 import cadquery as cq
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 
 @dataclass
@@ -64,6 +64,45 @@ class GearData:
     p: float
 
 
+@dataclass
+class GearDataBatch:
+    # structure-of-arrays counterpart of GearData, every field has shape (G,)
+    m_n: np.ndarray
+    m_t: np.ndarray
+    z: np.ndarray
+    b: np.ndarray
+    x: np.ndarray
+
+    alpha_t: np.ndarray
+    alpha_t_r: np.ndarray
+    alpha_n: np.ndarray
+    alpha_n_r: np.ndarray
+    beta: np.ndarray
+    beta_r: np.ndarray
+    beta_b: np.ndarray
+    beta_b_r: np.ndarray
+    delta: np.ndarray
+    delta_r: np.ndarray
+
+    ha_star: np.ndarray
+    c_star: np.ndarray
+    rho_f_star: np.ndarray
+
+    ha: np.ndarray
+    hf: np.ndarray
+    rho_f: np.ndarray
+
+    d: np.ndarray
+    db: np.ndarray
+    da: np.ndarray
+    df: np.ndarray
+
+    p: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.z)
+
+
 @dataclass
 class Gear:
     data: GearData
@@ -77,6 +116,61 @@ class GearList:
     groups: list[set[int]]
 
 
+def _derived_gear_data(
+    m_n: float | np.ndarray,
+    z: int | np.ndarray,
+    x: float | np.ndarray,
+    alpha_n: float | np.ndarray,
+    beta: float | np.ndarray,
+    delta: float | np.ndarray,
+    ha_star: float | np.ndarray,
+    c_star: float | np.ndarray,
+    rho_f_star: float | np.ndarray,
+) -> dict[str, float | np.ndarray]:
+    # the derived GearData fields, for a single gear or elementwise for (G,)
+    # arrays of gears; only NumPy operations so that both share the formulas
+    alpha_n_r = np.radians(alpha_n)
+    beta_r = np.radians(beta)
+    delta_r = np.radians(delta)
+
+    alpha_t_r = np.arctan(np.tan(alpha_n_r) / np.cos(beta_r))
+    alpha_t = np.degrees(alpha_t_r)
+
+    m_t = m_n / np.cos(beta_r)
+    p = np.pi * m_t
+
+    beta_b_r = np.arctan(np.tan(beta_r) * np.cos(alpha_t_r))
+    beta_b = np.degrees(beta_b_r)
+
+    ha = (ha_star + x) * m_n
+    hf = (ha_star + c_star - x) * m_n
+    rho_f = np.abs(rho_f_star) * m_n
+
+    d = m_t * z
+    db = d * np.cos(alpha_t_r)
+    df = d - 2 * hf
+    da = d + 2 * ha
+
+    return {
+        "m_t": m_t,
+        "alpha_t": alpha_t,
+        "alpha_t_r": alpha_t_r,
+        "alpha_n_r": alpha_n_r,
+        "beta_r": beta_r,
+        "beta_b": beta_b,
+        "beta_b_r": beta_b_r,
+        "delta_r": delta_r,
+        "ha": ha,
+        "hf": hf,
+        "rho_f": rho_f,
+        "d": d,
+        "db": db,
+        "df": df,
+        "da": da,
+        "p": p,
+    }
+
+
 def compute_gear_data(
     m_n: float,
     z: int,
@@ -89,59 +183,85 @@ def compute_gear_data(
     c_star: float,
     rho_f_star: float,
 ) -> GearData:
-
-    alpha_n_r: float = np.radians(alpha_n)
-    beta_r: float = np.radians(beta)
-    delta_r: float = np.radians(delta)
-
-    alpha_t_r: float = np.arctan(np.tan(alpha_n_r) / np.cos(beta_r))
-    alpha_t: float = np.degrees(alpha_t_r)
-
-    m_t: float = m_n / np.cos(beta_r)
-    p: float = np.pi * m_t
-
-    beta_b_r: float = np.arctan(np.tan(beta_r) * np.cos(alpha_t_r))
-    beta_b: float = np.degrees(beta_b_r)
-
-    ha: float = (ha_star + x) * m_n
-    hf: float = (ha_star + c_star - x) * m_n
-    rho_f: float = abs(rho_f_star) * m_n
-
-    d: float = m_t * float(z)
-    db: float = d * np.cos(alpha_t_r)
-    df: float = d - 2 * hf
-    da: float = d + 2 * ha
-
     return GearData(
         m_n=m_n,
-        m_t=m_t,
         z=z,
         b=b,
         x=x,
-        alpha_t=alpha_t,
-        alpha_t_r=alpha_t_r,
         alpha_n=alpha_n,
-        alpha_n_r=alpha_n_r,
         beta=beta,
-        beta_r=beta_r,
-        beta_b=beta_b,
-        beta_b_r=beta_b_r,
         delta=delta,
-        delta_r=delta_r,
         ha_star=ha_star,
         c_star=c_star,
         rho_f_star=rho_f_star,
-        ha=ha,
-        hf=hf,
-        rho_f=rho_f,
-        d=d,
-        db=db,
-        df=df,
-        da=da,
-        p=p,
+        **_derived_gear_data(  # type: ignore
+            m_n, z, x, alpha_n, beta, delta, ha_star, c_star, rho_f_star
+        ),
     )
 
 
+def compute_gear_data_batch(
+    m_n: float | np.ndarray,
+    z: int | np.ndarray,
+    b: float | np.ndarray,
+    x: float | np.ndarray,
+    alpha_n: float | np.ndarray,
+    beta: float | np.ndarray,
+    delta: float | np.ndarray,
+    ha_star: float | np.ndarray,
+    c_star: float | np.ndarray,
+    rho_f_star: float | np.ndarray,
+) -> GearDataBatch:
+    (
+        m_n,
+        z,
+        b,
+        x,
+        alpha_n,
+        beta,
+        delta,
+        ha_star,
+        c_star,
+        rho_f_star,
+    ) = np.broadcast_arrays(
+        *(
+            np.atleast_1d(np.asarray(arg, dtype=float))
+            for arg in (m_n, z, b, x, alpha_n, beta, delta, ha_star, c_star, rho_f_star)
+        )
+    )
+    if m_n.ndim != 1:
+        raise ValueError(
+            f"gear parameters must broadcast to shape (G,), got {m_n.shape}"
+        )
+
+    return GearDataBatch(
+        m_n=m_n.copy(),
+        z=z.astype(int),
+        b=b.copy(),
+        x=x.copy(),
+        alpha_n=alpha_n.copy(),
+        beta=beta.copy(),
+        delta=delta.copy(),
+        ha_star=ha_star.copy(),
+        c_star=c_star.copy(),
+        rho_f_star=rho_f_star.copy(),
+        **_derived_gear_data(  # type: ignore
+            m_n, z, x, alpha_n, beta, delta, ha_star, c_star, rho_f_star
+        ),
+    )
+
+
+def stack_gear_data(gear_data_list: list[GearData]) -> GearDataBatch:
+    if len(gear_data_list) == 0:
+        raise ValueError("gear_data_list must contain at least one GearData")
+
+    columns: dict[str, np.ndarray] = {
+        field.name: np.array([getattr(gd, field.name) for gd in gear_data_list])
+        for field in fields(GearData)
+    }
+    return GearDataBatch(**columns)
+
+
 def _are_compatible(
     gear_data_a: GearData, gear_data_b: GearData, tolerance: float = 1e-6
 ) -> bool:
@@ -1,5 +1,12 @@
+import cadquery as cq
 import numpy as np
+from io import BytesIO
 from typing import NamedTuple
+from OCP.BRepBuilderAPI import BRepBuilderAPI_MakeEdge
+from OCP.Geom import Geom_BSplineCurve
+from OCP.gp import gp_Pnt
+from OCP.TColgp import TColgp_Array1OfPnt
+from OCP.TColStd import TColStd_Array1OfInteger, TColStd_Array1OfReal
 
 
 class CqArcTuple(NamedTuple):
@@ -60,13 +67,124 @@ def cq_spline_from_array(
 
     tan_list: list[tuple[float, float]] | None = None
     if tangents is not None:
-        if tangents.shape != (2, 2):
-            raise ValueError(f"tangents: expected shape (2,2), got {tangents.shape}")
-        tan_list = [
-            (float(tangents[0, 0]), float(tangents[1, 0])),
-            (float(tangents[0, 1]), float(tangents[1, 1])),
-        ]
+        # either the two end tangents or one tangent per point
+        if tangents.shape == points.shape and skip_first:
+            tangents = tangents[:, 1:]
+        if tangents.shape != (2, 2) and tangents.shape != (2, len(pts_list)):
+            raise ValueError(
+                f"tangents: expected shape (2,2) or (2,{len(pts_list)}), "
+                f"got {tangents.shape}"
+            )
+        tan_list = [(float(tx), float(ty)) for tx, ty in tangents.T]
 
     return CqSplineTuple(
         points=pts_list, tangents=tan_list, periodic=periodic, tag=None
     )
+
+
+def cq_spline_edge(
+    points: np.ndarray,
+    tangents: np.ndarray | None = None,
+    parameters: np.ndarray | None = None,
+) -> cq.Edge:
+    # with parameters the spline interpolates points at these parameter values
+    # and tangents are taken as exact derivatives with respect to them,
+    # otherwise OCC uses a chord length parametrization and rescales tangents
+    if points.ndim != 2 or points.shape[0] != 2:
+        raise ValueError(f"points: expect shape (2, N), got {points.shape}")
+    if points.shape[1] < 2:
+        raise ValueError(f"points: needs at least 2 columns, got {points.shape[1]}")
+
+    vectors: list[cq.Vector] = [
+        cq.Vector(float(px), float(py), 0.0) for px, py in points.T
+    ]
+
+    param_list: list[float] | None = None
+    if parameters is not None:
+        if parameters.shape != (points.shape[1],):
+            raise ValueError(
+                f"parameters: expected shape ({points.shape[1]},), "
+                f"got {parameters.shape}"
+            )
+        steps: np.ndarray = np.diff(parameters)
+        if np.all(steps < 0):
+            # OCC needs increasing parameters, t = -phi flips the derivatives
+            parameters = -parameters
+            tangents = None if tangents is None else -tangents
+        elif not np.all(steps > 0):
+            raise ValueError("parameters: must be strictly monotonic")
+        param_list = [float(p) for p in parameters]
+
+    tan_vectors: list[cq.Vector] | None = None
+    if tangents is not None:
+        if tangents.shape != (2, 2) and tangents.shape != points.shape:
+            raise ValueError(
+                f"tangents: expected shape (2,2) or {points.shape}, "
+                f"got {tangents.shape}"
+            )
+        tan_vectors = [cq.Vector(float(tx), float(ty), 0.0) for tx, ty in tangents.T]
+    return cq.Edge.makeSpline(
+        vectors,
+        tangents=tan_vectors,
+        parameters=param_list,
+        scale=param_list is None,
+    )
+
+
+def cq_bspline_edge(
+    control_points: np.ndarray, knots: np.ndarray, degree: int
+) -> cq.Edge:
+    # builds the Geom_BSplineCurve as given, no interpolation on the OCC side
+    if control_points.ndim != 2 or control_points.shape[0] != 2:
+        raise ValueError(
+            f"control_points: expect shape (2, M), got {control_points.shape}"
+        )
+    n_control: int = control_points.shape[1]
+    if knots.shape != (n_control + degree + 1,):
+        raise ValueError(
+            f"knots: expected shape ({n_control + degree + 1},), got {knots.shape}"
+        )
+
+    poles: TColgp_Array1OfPnt = TColgp_Array1OfPnt(1, n_control)
+    for i, (px, py) in enumerate(control_points.T, start=1):
+        poles.SetValue(i, gp_Pnt(float(px), float(py), 0.0))
+
+    unique_knots, multiplicities = np.unique(knots, return_counts=True)
+    occ_knots: TColStd_Array1OfReal = TColStd_Array1OfReal(1, len(unique_knots))
+    occ_mults: TColStd_Array1OfInteger = TColStd_Array1OfInteger(1, len(unique_knots))
+    for i, (knot, mult) in enumerate(zip(unique_knots, multiplicities), start=1):
+        occ_knots.SetValue(i, float(knot))
+        occ_mults.SetValue(i, int(mult))
+
+    curve: Geom_BSplineCurve = Geom_BSplineCurve(poles, occ_knots, occ_mults, degree)
+    return cq.Edge(BRepBuilderAPI_MakeEdge(curve).Edge())
+
+
+def cq_arc_edge(
+    arc_start: np.ndarray, arc_mid: np.ndarray, arc_end: np.ndarray
+) -> cq.Edge:
+    return cq.Edge.makeThreePointArc(
+        cq.Vector(float(arc_start[0]), float(arc_start[1]), 0.0),
+        cq.Vector(float(arc_mid[0]), float(arc_mid[1]), 0.0),
+        cq.Vector(float(arc_end[0]), float(arc_end[1]), 0.0),
+    )
+
+
+def workplane_to_brep(workplane: cq.Workplane) -> bytes:
+    shapes: list[cq.Shape] = [
+        obj for obj in workplane.vals() if isinstance(obj, cq.Shape)
+    ]
+    if len(shapes) == 0:
+        raise ValueError("workplane holds no shapes to export")
+    shape: cq.Shape = (
+        shapes[0] if len(shapes) == 1 else cq.Compound.makeCompound(shapes)
+    )
+
+    buffer: BytesIO = BytesIO()
+    shape.exportBrep(buffer)
+    return buffer.getvalue()
+
+
+def workplane_from_brep(data: bytes) -> cq.Workplane:
+    shape: cq.Shape = cq.Shape.importBrep(BytesIO(data))
+    return cq.Workplane().add(shape)
@@ -1,5 +1,6 @@
 import numpy as np
-from typing import Literal
+from scipy.interpolate import BSpline
+from typing import Callable, Literal, NamedTuple
 
 
 def ensure_has_zero(arr: np.ndarray) -> np.ndarray:
@@ -31,6 +32,173 @@ def tangent_angles(points: np.ndarray) -> np.ndarray:
     return angles
 
 
+def _chord_deviation(
+    chord_start: np.ndarray, chord_end: np.ndarray, points: np.ndarray
+) -> np.ndarray:
+    chord: np.ndarray = chord_end - chord_start
+    offset: np.ndarray = points - chord_start
+    chord_length: np.ndarray = np.linalg.norm(chord, axis=0)
+    cross: np.ndarray = np.abs(chord[0] * offset[1] - chord[1] * offset[0])
+    return np.where(
+        chord_length > 0.0,
+        cross / np.where(chord_length > 0.0, chord_length, 1.0),
+        np.linalg.norm(offset, axis=0),
+    )
+
+
+def adaptive_phi(
+    curve: Callable[[np.ndarray], np.ndarray],
+    phi_start_r: float,
+    phi_end_r: float,
+    tolerance: float,
+    max_points: int = 2000,
+) -> np.ndarray:
+    # bisects every parameter interval whose chord deviates more than tolerance
+    # from the curve at the interval midpoint, so flat stretches keep few points
+    # and strongly curved ones get refined
+    if tolerance <= 0:
+        raise ValueError(f"tolerance must be positive. Instead got {tolerance}")
+
+    phi: np.ndarray = np.linspace(phi_start_r, phi_end_r, 3)
+    points: np.ndarray = curve(phi)
+
+    while True:
+        phi_mid: np.ndarray = (phi[:-1] + phi[1:]) / 2
+        points_mid: np.ndarray = curve(phi_mid)
+        deviation: np.ndarray = _chord_deviation(
+            points[:, :-1], points[:, 1:], points_mid
+        )
+        refine: np.ndarray = deviation > tolerance
+        n_refine: int = int(np.count_nonzero(refine))
+        if n_refine == 0:
+            return phi
+        if len(phi) + n_refine > max_points:
+            raise ValueError(
+                f"tolerance {tolerance} needs more than max_points={max_points} points"
+            )
+
+        insert_at: np.ndarray = np.nonzero(refine)[0] + 1
+        phi = np.insert(phi, insert_at, phi_mid[refine])
+        points = np.insert(points, insert_at, points_mid[:, refine], axis=1)
+
+
+class BSplineFit(NamedTuple):
+    control_points: np.ndarray  # shape (2, M)
+    knots: np.ndarray  # clamped knot vector on [0, 1], shape (M + degree + 1,)
+    degree: int
+    max_deviation: float
+
+
+def _bspline_samples(breaks: np.ndarray, samples_per_span: int) -> np.ndarray:
+    steps: np.ndarray = np.linspace(0.0, 1.0, samples_per_span, endpoint=False)
+    starts: np.ndarray = breaks[:-1, None]
+    widths: np.ndarray = np.diff(breaks)[:, None]
+    return np.append((starts + widths * steps).ravel(), 1.0)
+
+
+def fit_bspline(
+    curve: Callable[[np.ndarray], np.ndarray],
+    phi_start_r: float,
+    phi_end_r: float,
+    tolerance: float,
+    degree: int = 3,
+    samples_per_span: int = 16,
+    max_spans: int = 256,
+    derivative: Callable[[np.ndarray], np.ndarray] | None = None,
+) -> BSplineFit:
+    # least squares B-spline through the exact curve ends, on a normalized
+    # parameter t in [0, 1]. Spans whose deviation from curve at the same
+    # parameter exceeds tolerance are bisected until none does. The parametric
+    # deviation bounds the distance to the curve from above and is verified on
+    # a grid four times denser than the one fitted to. With derivative
+    # (d curve / d phi) the end tangents are matched as well, which the
+    # deviation bound alone does not do: a curve tangent to a circle at its
+    # end can otherwise be fitted by a spline that crosses the circle.
+    if tolerance <= 0:
+        raise ValueError(f"tolerance must be positive. Instead got {tolerance}")
+    if samples_per_span <= degree:
+        raise ValueError(
+            f"samples_per_span must be greater than degree. "
+            f"Instead got {samples_per_span}"
+        )
+
+    def curve_t(t: np.ndarray) -> np.ndarray:
+        return curve(phi_start_r + t * (phi_end_r - phi_start_r)).T  # shape (S, 2)
+
+    end_derivatives: np.ndarray | None = None
+    if derivative is not None:
+        if degree < 2:
+            raise ValueError(
+                f"Matching end tangents needs degree 2 or higher. Instead got {degree}"
+            )
+        # d curve / d t at t = 0 and t = 1, shape (2, 2)
+        end_derivatives = (phi_end_r - phi_start_r) * derivative(
+            np.array([phi_start_r, phi_end_r])
+        ).T
+
+    breaks: np.ndarray = np.array([0.0, 1.0])
+    while True:
+        knots: np.ndarray = np.concatenate(
+            [np.zeros(degree), breaks, np.ones(degree)]
+        )
+        n_control: int = len(knots) - degree - 1
+
+        t_fit: np.ndarray = _bspline_samples(breaks, samples_per_span)
+        y_fit: np.ndarray = curve_t(t_fit)
+        basis: np.ndarray = BSpline.design_matrix(t_fit, knots, degree).toarray()
+
+        # the end control points of a clamped spline are its end points, and
+        # its end tangents are degree / (first or last span) times the offset
+        # of the neighbouring control points
+        control_points: np.ndarray = np.empty((n_control, 2))
+        control_points[0] = y_fit[0]
+        control_points[-1] = y_fit[-1]
+        fixed: list[int] = [0, n_control - 1]
+        if end_derivatives is not None:
+            control_points[1] = (
+                control_points[0] + breaks[1] / degree * end_derivatives[0]
+            )
+            control_points[-2] = (
+                control_points[-1] - (1.0 - breaks[-2]) / degree * end_derivatives[1]
+            )
+            fixed = [0, 1, n_control - 2, n_control - 1]
+        free: np.ndarray = np.setdiff1d(np.arange(n_control), fixed)
+        rhs: np.ndarray = y_fit - basis[:, fixed] @ control_points[fixed]
+        if len(free) > 0:
+            control_points[free] = np.linalg.lstsq(
+                basis[:, free], rhs, rcond=None
+            )[0]
+
+        t_check: np.ndarray = _bspline_samples(breaks, 4 * samples_per_span)
+        deviation: np.ndarray = np.linalg.norm(
+            BSpline(knots, control_points, degree)(t_check) - curve_t(t_check),
+            axis=1,
+        )
+        span: np.ndarray = np.minimum(
+            np.searchsorted(breaks, t_check, side="right") - 1, len(breaks) - 2
+        )
+        span_deviation: np.ndarray = np.zeros(len(breaks) - 1)
+        np.maximum.at(span_deviation, span, deviation)
+
+        refine: np.ndarray = span_deviation > tolerance
+        if not np.any(refine):
+            return BSplineFit(
+                control_points.T, knots, degree, float(span_deviation.max())
+            )
+        if len(breaks) - 1 + np.count_nonzero(refine) > max_spans:
+            raise ValueError(
+                f"tolerance {tolerance} needs more than max_spans={max_spans} spans"
+            )
+        midpoints: np.ndarray = (breaks[:-1] + breaks[1:])[refine] / 2
+        breaks = np.sort(np.concatenate([breaks, midpoints]))
+
+
+def reverse_bspline(fit: BSplineFit) -> BSplineFit:
+    return BSplineFit(
+        fit.control_points[:, ::-1], 1.0 - fit.knots[::-1], fit.degree, fit.max_deviation
+    )
+
+
 def half_base_tooth_angle(
     m: float, x: float, dp: float, db: float, alpha_n_r: float
 ) -> float:
@@ -56,6 +224,25 @@ def involute_phi_d(d_star: float, db: float, flank: Literal["right", "left"]) ->
     return phi
 
 
+class SelfIntersectionResult(NamedTuple):
+    phi: float | np.ndarray
+    n_iter: int | np.ndarray
+    residual: float | np.ndarray
+    converged: bool | np.ndarray
+
+
+def _self_intersection_step(
+    phi: float | np.ndarray, tan_gamma: float | np.ndarray
+) -> tuple[float | np.ndarray, float | np.ndarray]:
+    # Newton step and residual of
+    # (sin(phi) - phi cos(phi)) / (cos(phi) + phi sin(phi)) = tan(gamma)
+    a: float | np.ndarray = np.cos(phi) + phi * np.sin(phi)
+    b: float | np.ndarray = np.sin(phi) - phi * np.cos(phi)
+    step: float | np.ndarray = a / phi**2 * (b - tan_gamma * a)
+    residual: float | np.ndarray = np.abs(b / a - tan_gamma)
+    return step, residual
+
+
 def involute_self_intersection(
     phi_0: float,
     m: float,
@@ -65,35 +252,81 @@ def involute_self_intersection(
     alpha_n_r: float,
     n_iter: int = 200,
 ) -> float:
-    gamma: float = half_base_tooth_angle(m, x, dp, db, alpha_n_r)
-
-    def newton_raphson(phi: float) -> float:
-        a: float = np.cos(phi) + phi * np.sin(phi)
-        b: float = np.sin(phi) - phi * np.cos(phi)
-        return phi - a / phi**2 * (b - np.tan(gamma) * a)
-
-    phi: float = phi_0
-
-    for _ in range(n_iter):
-        phi = newton_raphson(phi)
-
-    return phi
+    # stops early once converged, involute_self_intersection_result also
+    # reports the iterations and residual
+    return involute_self_intersection_result(
+        phi_0, m, x, dp, db, alpha_n_r, max_iter=n_iter
+    ).phi  # type: ignore
 
 
-def involute_positioned(
+def involute_self_intersection_result(
+    phi_0: float,
     m: float,
     x: float,
     dp: float,
     db: float,
     alpha_n_r: float,
+    max_iter: int = 200,
+    tol: float = 1e-12,
+    residual_tol: float = 1e-14,
+) -> SelfIntersectionResult:
+    tan_gamma: float = np.tan(half_base_tooth_angle(m, x, dp, db, alpha_n_r))
+
+    phi: float = phi_0
+    step, residual = _self_intersection_step(phi, tan_gamma)
+    n_iter: int = 0
+    converged: bool = bool(residual <= residual_tol)
+
+    while not converged and n_iter < max_iter:
+        phi = phi - step
+        n_iter += 1
+        small_step: bool = bool(abs(step) <= tol)
+        step, residual = _self_intersection_step(phi, tan_gamma)
+        converged = small_step or bool(residual <= residual_tol)
+
+    return SelfIntersectionResult(phi, n_iter, residual, converged)
+
+
+def involute_self_intersection_batch(
+    phi_0: np.ndarray,
+    m: np.ndarray,
+    x: np.ndarray,
+    dp: np.ndarray,
+    db: np.ndarray,
+    alpha_n_r: np.ndarray,
+    max_iter: int = 200,
+    tol: float = 1e-12,
+    residual_tol: float = 1e-14,
+) -> SelfIntersectionResult:
+    tan_gamma: np.ndarray = np.tan(half_base_tooth_angle(m, x, dp, db, alpha_n_r))
+
+    phi: np.ndarray = np.array(phi_0, dtype=float)
+    step, residual = _self_intersection_step(phi, tan_gamma)
+    n_iter: np.ndarray = np.zeros(phi.shape, dtype=int)
+    converged: np.ndarray = residual <= residual_tol
+
+    for _ in range(max_iter):
+        active: np.ndarray = ~converged & np.isfinite(phi)
+        if not np.any(active):
+            break
+        phi = np.where(active, phi - step, phi)
+        n_iter += active
+        small_step: np.ndarray = np.abs(step) <= tol
+        step, residual = _self_intersection_step(phi, tan_gamma)
+        converged = converged | (active & (small_step | (residual <= residual_tol)))
+
+    return SelfIntersectionResult(phi, n_iter, residual, converged)
+
+
+def _involute_positioned_xy(
+    gamma: float | np.ndarray,
     phi_r: np.ndarray,
     flank: Literal["right", "left"],
-) -> np.ndarray:
-    gamma: float = half_base_tooth_angle(m, x, dp, db, alpha_n_r)
+) -> tuple[np.ndarray, np.ndarray]:
     cos_phi: np.ndarray = np.cos(phi_r)
     sin_phi: np.ndarray = np.sin(phi_r)
-    cos_gamma: float = np.cos(gamma)
-    sin_gamma: float = np.sin(gamma)
+    cos_gamma: float | np.ndarray = np.cos(gamma)
+    sin_gamma: float | np.ndarray = np.sin(gamma)
     if flank == "left":
         sin_gamma = -sin_gamma
     x_coord: np.ndarray = (
@@ -108,9 +341,68 @@ def involute_positioned(
         + cos_gamma * sin_phi
         - cos_gamma * phi_r * cos_phi
     )
+    return x_coord, y_coord
+
+
+def involute_positioned(
+    m: float,
+    x: float,
+    dp: float,
+    db: float,
+    alpha_n_r: float,
+    phi_r: np.ndarray,
+    flank: Literal["right", "left"],
+) -> np.ndarray:
+    gamma: float = half_base_tooth_angle(m, x, dp, db, alpha_n_r)
+    x_coord, y_coord = _involute_positioned_xy(gamma, phi_r, flank)
     return db / 2 * np.vstack([x_coord, y_coord])  # shape (2, N)
 
 
+def _involute_positioned_derivative_xy(
+    gamma: float | np.ndarray,
+    phi_r: np.ndarray,
+    flank: Literal["right", "left"],
+) -> tuple[np.ndarray, np.ndarray]:
+    cos_phi: np.ndarray = np.cos(phi_r)
+    sin_phi: np.ndarray = np.sin(phi_r)
+    cos_gamma: float | np.ndarray = np.cos(gamma)
+    sin_gamma: float | np.ndarray = np.sin(gamma)
+    if flank == "left":
+        sin_gamma = -sin_gamma
+    dx_coord: np.ndarray = phi_r * (cos_gamma * cos_phi + sin_gamma * sin_phi)
+    dy_coord: np.ndarray = phi_r * (cos_gamma * sin_phi - sin_gamma * cos_phi)
+    return dx_coord, dy_coord
+
+
+def involute_positioned_derivative(
+    m: float,
+    x: float,
+    dp: float,
+    db: float,
+    alpha_n_r: float,
+    phi_r: np.ndarray,
+    flank: Literal["right", "left"],
+) -> np.ndarray:
+    # d/dphi of involute_positioned
+    gamma: float = half_base_tooth_angle(m, x, dp, db, alpha_n_r)
+    dx_coord, dy_coord = _involute_positioned_derivative_xy(gamma, phi_r, flank)
+    return db / 2 * np.vstack([dx_coord, dy_coord])  # shape (2, N)
+
+
+def involute_positioned_batch(
+    m: np.ndarray,
+    x: np.ndarray,
+    dp: np.ndarray,
+    db: np.ndarray,
+    alpha_n_r: np.ndarray,
+    phi_r: np.ndarray,
+    flank: Literal["right", "left"],
+) -> np.ndarray:
+    gamma: np.ndarray = half_base_tooth_angle(m, x, dp, db, alpha_n_r)
+    x_coord, y_coord = _involute_positioned_xy(gamma[:, None], phi_r, flank)
+    return (db / 2)[:, None, None] * np.stack([x_coord, y_coord], axis=1)  # (G, 2, N)
+
+
 def involute_tooth(
     m: float,
     x: float,
@@ -128,6 +420,23 @@ def involute_tooth(
     return involute_positioned(m, x, dp, db, alpha_n_r, phi_arr_r, flank)
 
 
+def involute_tooth_batch(
+    m: np.ndarray,
+    x: np.ndarray,
+    dp: np.ndarray,
+    db: np.ndarray,
+    alpha_n_r: np.ndarray,
+    phi_start_r: np.ndarray,
+    phi_end_r: np.ndarray,
+    n_points: int,
+    flank: Literal["right", "left"],
+) -> np.ndarray:
+    if n_points < 3:
+        raise ValueError(f"n_points must be greater than 3. Instead got {n_points}")
+    phi_arr_r: np.ndarray = np.linspace(phi_start_r, phi_end_r, n_points, axis=-1)
+    return involute_positioned_batch(m, x, dp, db, alpha_n_r, phi_arr_r, flank)
+
+
 def rotate(points: np.ndarray, rotation: float) -> np.ndarray:
     R: np.ndarray = np.array(
         [[np.cos(rotation), -np.sin(rotation)], [np.sin(rotation), np.cos(rotation)]]
@@ -136,6 +445,17 @@ def rotate(points: np.ndarray, rotation: float) -> np.ndarray:
     return rotated
 
 
+def rotate_copies(points: np.ndarray, rotations: np.ndarray) -> np.ndarray:
+    cos_r: np.ndarray = np.cos(rotations)
+    sin_r: np.ndarray = np.sin(rotations)
+    R: np.ndarray = np.stack(
+        [np.stack([cos_r, -sin_r], axis=-1), np.stack([sin_r, cos_r], axis=-1)],
+        axis=-2,
+    )  # shape (K, 2, 2)
+    rotated: np.ndarray = R @ points  # shape (K, 2, N)
+    return rotated
+
+
 def translate(points: np.ndarray, translation: tuple[float, float]) -> np.ndarray:
     dx, dy = translation
     translated: np.ndarray = points + np.array([[dx], [dy]])
@@ -186,6 +506,76 @@ def undercut_phi_0(
     return phi
 
 
+class UndercutIntersectionResult(NamedTuple):
+    phi_inv: float | np.ndarray
+    phi_undercut: float | np.ndarray
+    n_iter: int | np.ndarray
+    residual: float | np.ndarray
+    converged: bool | np.ndarray
+
+
+def _undercut_intersection_coefficients(
+    df: float | np.ndarray,
+    alpha_t_r: float | np.ndarray,
+    flank: Literal["right", "left"],
+) -> tuple[float | np.ndarray, ...]:
+    a: float | np.ndarray = df
+    b: float | np.ndarray = df * np.tan(alpha_t_r)
+    c: float | np.ndarray = np.cos(alpha_t_r)
+    d: float | np.ndarray = np.sin(alpha_t_r)
+
+    if flank == "left":
+        b = -b
+        d = -d
+
+    return a, b, c, d
+
+
+def _undercut_intersection_step(
+    phi_i: float | np.ndarray,
+    phi_u: float | np.ndarray,
+    a: float | np.ndarray,
+    b: float | np.ndarray,
+    c: float | np.ndarray,
+    d: float | np.ndarray,
+    dp: float | np.ndarray,
+    db: float | np.ndarray,
+) -> tuple[float | np.ndarray, ...]:
+    # Newton step J^-1 F (closed-form 2x2 inverse) and residual |F| / db
+    cos_i: float | np.ndarray = np.cos(phi_i)
+    sin_i: float | np.ndarray = np.sin(phi_i)
+    cos_u: float | np.ndarray = np.cos(phi_u)
+    sin_u: float | np.ndarray = np.sin(phi_u)
+
+    J_11: float | np.ndarray = db * phi_i * (c * cos_i - d * sin_i)
+    J_12: float | np.ndarray = a * sin_u + b * cos_u - dp * sin_u - dp * phi_u * cos_u
+    J_21: float | np.ndarray = db * phi_i * (d * cos_i + c * sin_i)
+    J_22: float | np.ndarray = b * sin_u - a * cos_u + dp * cos_u - dp * phi_u * sin_u
+    f_1: float | np.ndarray = (
+        db * c * cos_i
+        + db * c * phi_i * sin_i
+        - db * d * sin_i
+        + db * d * phi_i * cos_i
+        - a * cos_u
+        + b * sin_u
+        - dp * phi_u * sin_u
+    )
+    f_2: float | np.ndarray = (
+        db * d * cos_i
+        + db * d * phi_i * sin_i
+        + db * c * sin_i
+        - db * c * phi_i * cos_i
+        - b * cos_u
+        - a * sin_u
+        + dp * phi_u * cos_u
+    )
+    det: float | np.ndarray = J_11 * J_22 - J_12 * J_21
+    step_i: float | np.ndarray = (J_22 * f_1 - J_12 * f_2) / det
+    step_u: float | np.ndarray = (J_11 * f_2 - J_21 * f_1) / det
+    residual: float | np.ndarray = np.hypot(f_1, f_2) / db
+    return step_i, step_u, residual
+
+
 def undercut_involute_intersection(
     phi_0_inv: float,
     phi_0_undercut: float,
@@ -196,83 +586,106 @@ def undercut_involute_intersection(
     flank: Literal["right", "left"],
     n_iter: int = 200,
 ) -> tuple[float, float]:
-    a: float = df
-    b: float = df * np.tan(alpha_t_r)
-    c: float = np.cos(alpha_t_r)
-    d: float = np.sin(alpha_t_r)
+    # stops early once converged, undercut_involute_intersection_result also
+    # reports the iterations and residual
+    result: UndercutIntersectionResult = undercut_involute_intersection_result(
+        phi_0_inv, phi_0_undercut, df, dp, db, alpha_t_r, flank, max_iter=n_iter
+    )
+    return result.phi_inv, result.phi_undercut  # type: ignore
 
-    if flank == "left":
-        b = -b
-        d = -d
 
-    def newton_raphson(x: np.ndarray) -> np.ndarray:
-        J_11: float = db * x[0] * (c * np.cos(x[0]) - d * np.sin(x[0]))
-        J_12: float = (
-            a * np.sin(x[1])
-            + b * np.cos(x[1])
-            - dp * np.sin(x[1])
-            - dp * x[1] * np.cos(x[1])
-        )
-        J_21: float = db * x[0] * (d * np.cos(x[0]) + c * np.sin(x[0]))
-        J_22: float = (
-            b * np.sin(x[1])
-            - a * np.cos(x[1])
-            + dp * np.cos(x[1])
-            - dp * x[1] * np.sin(x[1])
-        )
-        J_inv: np.ndarray = (
-            1 / (J_11 * J_22 - J_12 * J_21) * np.array([[J_22, -J_12], [-J_21, J_11]])
-        )
-        f: np.ndarray = np.array(
-            [
-                db * c * np.cos(x[0])
-                + db * c * x[0] * np.sin(x[0])
-                - db * d * np.sin(x[0])
-                + db * d * x[0] * np.cos(x[0])
-                - a * np.cos(x[1])
-                + b * np.sin(x[1])
-                - dp * x[1] * np.sin(x[1]),
-                db * d * np.cos(x[0])
-                + db * d * x[0] * np.sin(x[0])
-                + db * c * np.sin(x[0])
-                - db * c * x[0] * np.cos(x[0])
-                - b * np.cos(x[1])
-                - a * np.sin(x[1])
-                + dp * x[1] * np.cos(x[1]),
-            ]
+def undercut_involute_intersection_result(
+    phi_0_inv: float,
+    phi_0_undercut: float,
+    df: float,
+    dp: float,
+    db: float,
+    alpha_t_r: float,
+    flank: Literal["right", "left"],
+    max_iter: int = 200,
+    tol: float = 1e-12,
+    residual_tol: float = 1e-14,
+) -> UndercutIntersectionResult:
+    a, b, c, d = _undercut_intersection_coefficients(df, alpha_t_r, flank)
+
+    phi_i: float = phi_0_inv
+    phi_u: float = phi_0_undercut
+    step_i, step_u, residual = _undercut_intersection_step(
+        phi_i, phi_u, a, b, c, d, dp, db
+    )
+    n_iter: int = 0
+    converged: bool = bool(residual <= residual_tol)
+
+    # near-tangent intersections (barely any undercut) form a double root where
+    # Newton only converges linearly, the residual check ends those early
+    while not converged and n_iter < max_iter:
+        phi_i = phi_i - step_i
+        phi_u = phi_u - step_u
+        n_iter += 1
+        small_step: bool = bool(max(abs(step_i), abs(step_u)) <= tol)
+        step_i, step_u, residual = _undercut_intersection_step(
+            phi_i, phi_u, a, b, c, d, dp, db
         )
-        return x - J_inv @ f
+        converged = small_step or bool(residual <= residual_tol)
 
-    phi: np.ndarray = np.array([phi_0_inv, phi_0_undercut])
+    return UndercutIntersectionResult(phi_i, phi_u, n_iter, residual, converged)
 
-    for _ in range(n_iter):
-        phi = newton_raphson(phi)
 
-    return phi[0], phi[1]
+def undercut_involute_intersection_batch(
+    phi_0_inv: np.ndarray,
+    phi_0_undercut: np.ndarray,
+    df: np.ndarray,
+    dp: np.ndarray,
+    db: np.ndarray,
+    alpha_t_r: np.ndarray,
+    flank: Literal["right", "left"],
+    max_iter: int = 200,
+    tol: float = 1e-12,
+    residual_tol: float = 1e-14,
+) -> UndercutIntersectionResult:
+    a, b, c, d = _undercut_intersection_coefficients(df, alpha_t_r, flank)
+
+    phi_i: np.ndarray = np.array(phi_0_inv, dtype=float)
+    phi_u: np.ndarray = np.array(phi_0_undercut, dtype=float)
+    step_i, step_u, residual = _undercut_intersection_step(
+        phi_i, phi_u, a, b, c, d, dp, db
+    )
+    n_iter: np.ndarray = np.zeros(phi_i.shape, dtype=int)
+    converged: np.ndarray = residual <= residual_tol
+
+    for _ in range(max_iter):
+        active: np.ndarray = ~converged & np.isfinite(phi_i) & np.isfinite(phi_u)
+        if not np.any(active):
+            break
+        phi_i = np.where(active, phi_i - step_i, phi_i)
+        phi_u = np.where(active, phi_u - step_u, phi_u)
+        n_iter += active
+        small_step: np.ndarray = np.maximum(np.abs(step_i), np.abs(step_u)) <= tol
+        step_i, step_u, residual = _undercut_intersection_step(
+            phi_i, phi_u, a, b, c, d, dp, db
+        )
+        converged = converged | (active & (small_step | (residual <= residual_tol)))
 
+    return UndercutIntersectionResult(phi_i, phi_u, n_iter, residual, converged)
 
-def undercut_curve_positioned(
-    m: float,
-    x: float,
-    df: float,
-    dp: float,
-    db: float,
-    alpha_n_r: float,
-    alpha_t_r: float,
+
+def _undercut_curve_positioned_xy(
+    df: float | np.ndarray,
+    dp: float | np.ndarray,
+    gamma: float | np.ndarray,
+    alpha_t_r: float | np.ndarray,
     phi: np.ndarray,
     flank: Literal["right", "left"],
-) -> np.ndarray:
-
-    a: float = df
-    b: float = df * np.tan(alpha_t_r)
+) -> tuple[np.ndarray, np.ndarray]:
+    a: float | np.ndarray = df
+    b: float | np.ndarray = df * np.tan(alpha_t_r)
 
-    gamma: float = half_base_tooth_angle(m, x, dp, db, alpha_n_r)
-    angle: float = gamma + alpha_t_r
+    angle: float | np.ndarray = gamma + alpha_t_r
 
     cos_phi: np.ndarray = np.cos(phi)
     sin_phi: np.ndarray = np.sin(phi)
-    cos_angle: float = np.cos(angle)
-    sin_angle: float = np.sin(angle)
+    cos_angle: float | np.ndarray = np.cos(angle)
+    sin_angle: float | np.ndarray = np.sin(angle)
 
     if flank == "left":
         sin_angle = -sin_angle
@@ -296,9 +709,107 @@ def undercut_curve_positioned(
         - dp * cos_angle * phi * cos_phi
     )
 
+    return x_coord, y_coord
+
+
+def undercut_curve_positioned(
+    m: float,
+    x: float,
+    df: float,
+    dp: float,
+    db: float,
+    alpha_n_r: float,
+    alpha_t_r: float,
+    phi: np.ndarray,
+    flank: Literal["right", "left"],
+) -> np.ndarray:
+    gamma: float = half_base_tooth_angle(m, x, dp, db, alpha_n_r)
+    x_coord, y_coord = _undercut_curve_positioned_xy(
+        df, dp, gamma, alpha_t_r, phi, flank
+    )
     return 0.5 * np.vstack([x_coord, y_coord])  # shape (2, N)
 
 
+def _undercut_curve_positioned_derivative_xy(
+    df: float | np.ndarray,
+    dp: float | np.ndarray,
+    gamma: float | np.ndarray,
+    alpha_t_r: float | np.ndarray,
+    phi: np.ndarray,
+    flank: Literal["right", "left"],
+) -> tuple[np.ndarray, np.ndarray]:
+    a: float | np.ndarray = df
+    b: float | np.ndarray = df * np.tan(alpha_t_r)
+
+    angle: float | np.ndarray = gamma + alpha_t_r
+
+    cos_phi: np.ndarray = np.cos(phi)
+    sin_phi: np.ndarray = np.sin(phi)
+    cos_angle: float | np.ndarray = np.cos(angle)
+    sin_angle: float | np.ndarray = np.sin(angle)
+
+    if flank == "left":
+        sin_angle = -sin_angle
+        b = -b
+
+    dx_coord: np.ndarray = (
+        -a * cos_angle * sin_phi
+        - b * cos_angle * cos_phi
+        + dp * cos_angle * (sin_phi + phi * cos_phi)
+        - b * sin_angle * sin_phi
+        + a * sin_angle * cos_phi
+        - dp * sin_angle * (cos_phi - phi * sin_phi)
+    )
+
+    dy_coord: np.ndarray = (
+        a * sin_angle * sin_phi
+        + b * sin_angle * cos_phi
+        - dp * sin_angle * (sin_phi + phi * cos_phi)
+        - b * cos_angle * sin_phi
+        + a * cos_angle * cos_phi
+        - dp * cos_angle * (cos_phi - phi * sin_phi)
+    )
+
+    return dx_coord, dy_coord
+
+
+def undercut_curve_positioned_derivative(
+    m: float,
+    x: float,
+    df: float,
+    dp: float,
+    db: float,
+    alpha_n_r: float,
+    alpha_t_r: float,
+    phi: np.ndarray,
+    flank: Literal["right", "left"],
+) -> np.ndarray:
+    # d/dphi of undercut_curve_positioned
+    gamma: float = half_base_tooth_angle(m, x, dp, db, alpha_n_r)
+    dx_coord, dy_coord = _undercut_curve_positioned_derivative_xy(
+        df, dp, gamma, alpha_t_r, phi, flank
+    )
+    return 0.5 * np.vstack([dx_coord, dy_coord])  # shape (2, N)
+
+
+def undercut_curve_positioned_batch(
+    m: np.ndarray,
+    x: np.ndarray,
+    df: np.ndarray,
+    dp: np.ndarray,
+    db: np.ndarray,
+    alpha_n_r: np.ndarray,
+    alpha_t_r: np.ndarray,
+    phi: np.ndarray,
+    flank: Literal["right", "left"],
+) -> np.ndarray:
+    gamma: np.ndarray = half_base_tooth_angle(m, x, dp, db, alpha_n_r)
+    x_coord, y_coord = _undercut_curve_positioned_xy(
+        df[:, None], dp[:, None], gamma[:, None], alpha_t_r[:, None], phi, flank
+    )
+    return 0.5 * np.stack([x_coord, y_coord], axis=1)  # shape (G, 2, N)
+
+
 def undercut_tooth(
     m: float,
     x: float,
@@ -318,6 +829,25 @@ def undercut_tooth(
     )
 
 
+def undercut_tooth_batch(
+    m: np.ndarray,
+    x: np.ndarray,
+    dp: np.ndarray,
+    db: np.ndarray,
+    df: np.ndarray,
+    alpha_n_r: np.ndarray,
+    alpha_t_r: np.ndarray,
+    phi_end_r: np.ndarray,
+    n_points: int,
+    flank: Literal["right", "left"],
+) -> np.ndarray:
+    phi_start_r: np.ndarray = undercut_phi_0(dp, df, alpha_t_r, flank)
+    phi_arr_r: np.ndarray = np.linspace(phi_start_r, phi_end_r, n_points, axis=-1)
+    return undercut_curve_positioned_batch(
+        m, x, df, dp, db, alpha_n_r, alpha_t_r, phi_arr_r, flank
+    )
+
+
 def undercut_curve_intuitive(
     rp: float,
     rf: float,
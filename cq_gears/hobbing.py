@@ -3,9 +3,262 @@ import numpy as np
 from typing import Literal
 from pathlib import Path
 import pyvista as pv
+from OCP.BRepBuilderAPI import BRepBuilderAPI_Transform
+from OCP.gp import gp_Trsf
 
-from .core import Gear
-from .visualization import setup_visualization, visualize_step
+from .cache import cache_key
+from .core import Gear, GearData
+from .parametric_gear import extrude_gear_profile
+from .rack import rack_period_segments
+from .video import FrameEncoder
+from .visualization import (
+    FrameRenderer,
+    RenderQueue,
+    RigidMesh,
+    setup_visualization,
+    visualize_step,
+)
+
+# "sequential": every rack position is cut from the 3D blank
+# "transverse": the rack section in the z=0 plane is cut from a blank disc at
+# every position and the resulting profile is extruded (twisted for helical
+# gears) once. Far cheaper 2D booleans and identical for spur gears.
+# "sector": as "transverse", but only the blank sector of one tooth pitch is
+# cut, by the rack positions that reach it, and then patterned z times
+HobbingMode = Literal["sequential", "transverse", "sector"]
+
+
+def rack_transforms(
+    geardata: GearData, num_cut_positions: int, mode: HobbingMode = "sequential"
+) -> np.ndarray:
+    # (N, 4, 4) rigid transforms of the rack at every cut position: shifted by
+    # -x_rack along the pitch line, moved down to the pitch circle and rolled
+    # by theta = x_rack / r about the gear axis. In sector mode the shift is
+    # x_rack modulo p, which the periodic short rack cannot tell apart.
+    p: float = geardata.p
+    r: float = geardata.d / 2
+    t: np.ndarray = np.arange(num_cut_positions) / num_cut_positions
+    x_rack: np.ndarray = p * geardata.z * (1 / 2 - t)
+    theta: np.ndarray = x_rack / r
+    x_shift: np.ndarray = x_rack
+    if mode == "sector":
+        x_shift = x_rack - p * np.round(x_rack / p)
+
+    cos_t: np.ndarray = np.cos(theta)
+    sin_t: np.ndarray = np.sin(theta)
+    transforms: np.ndarray = np.zeros((num_cut_positions, 4, 4))
+    transforms[:, 0, 0] = cos_t
+    transforms[:, 0, 1] = -sin_t
+    transforms[:, 1, 0] = sin_t
+    transforms[:, 1, 1] = cos_t
+    transforms[:, 0, 3] = -cos_t * x_shift + sin_t * r
+    transforms[:, 1, 3] = -sin_t * x_shift - cos_t * r
+    transforms[:, 2, 2] = 1.0
+    transforms[:, 3, 3] = 1.0
+    return transforms
+
+
+def rack_placements(transforms: np.ndarray) -> list[gp_Trsf]:
+    # one gp_Trsf per rack position, shared by all gears with the same positions
+    placements: list[gp_Trsf] = []
+    for transform in transforms:
+        trsf: gp_Trsf = gp_Trsf()
+        trsf.SetValues(*transform[:3].ravel())
+        placements.append(trsf)
+    return placements
+
+
+def _place(shape: cq.Shape, trsf: gp_Trsf) -> cq.Shape:
+    # a single copy per position. A located reference (shape.moved) avoids the
+    # copy but makes every boolean against it slower than the copy costs.
+    return cq.Shape.cast(BRepBuilderAPI_Transform(shape.wrapped, trsf, True).Shape())
+
+
+def _sector_face(radius: float, start_angle: float, sweep_angle: float) -> cq.Face:
+    angles: np.ndarray = start_angle + sweep_angle * np.array([0.0, 0.5, 1.0])
+    start, mid, end = (
+        cq.Vector(radius * np.cos(angle), radius * np.sin(angle), 0.0)
+        for angle in angles
+    )
+    return cq.Face.makeFromWires(
+        cq.Wire.assembleEdges(
+            [
+                cq.Edge.makeLine(cq.Vector(), start),
+                cq.Edge.makeThreePointArc(start, mid, end),
+                cq.Edge.makeLine(end, cq.Vector()),
+            ]
+        )
+    )
+
+
+def _short_rack_section(
+    rack_section: cq.Shape, p: float, r: float, r_blank: float
+) -> cq.Shape:
+    # the rack only reaches into the blank within the blank chord at the rack
+    # tips. Shifted by the rack position modulo p, a piece of the periodic
+    # rack that spans this chord plus one pitch acts like the whole rack.
+    bb: cq.BoundBox = rack_section.BoundingBox()
+    half_chord: float = float(np.sqrt(r_blank**2 - (r - bb.ymax) ** 2))
+    window: cq.Face = cq.Face.makePlane(
+        2 * half_chord + 2 * p, bb.ylen + 2 * p, cq.Vector(0.0, bb.center.y, 0.0)
+    )
+    return rack_section.intersect(window)
+
+
+def _boxes_overlap(a: cq.BoundBox, b: cq.BoundBox) -> bool:
+    return (
+        a.xmin <= b.xmax and b.xmin <= a.xmax and a.ymin <= b.ymax and b.ymin <= a.ymax
+    )
+
+
+def _checkpoint_key(gear: Gear) -> str:
+    # everything a checkpoint depends on besides mode and num_cut_positions:
+    # the gear and the rack, whose length and width depend on its group
+    rack_box: cq.BoundBox = gear.rack.val().BoundingBox()  # type: ignore
+    return cache_key(
+        "hobbing_checkpoint",
+        geardata=gear.data,
+        rack=[
+            rack_box.xmin,
+            rack_box.xmax,
+            rack_box.ymin,
+            rack_box.ymax,
+            rack_box.zmin,
+            rack_box.zmax,
+        ],
+    )[:16]
+
+
+def _write_checkpoint(
+    checkpoint_dir: Path, key: str, shape: cq.Shape, position: int, cut_counter: int
+) -> None:
+    # the partially cut state after `position` rack positions, with the frame
+    # counter so that a resumed run continues the visualization numbering.
+    # Written to a temporary file first so that a job killed mid-write leaves
+    # the previous checkpoint intact, which is then removed.
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    path: Path = (
+        checkpoint_dir / f"checkpoint_{key}_{position:05d}_{cut_counter:05d}.brep"
+    )
+    tmp_path: Path = path.with_suffix(".tmp")
+    shape.exportBrep(str(tmp_path))
+    tmp_path.replace(path)
+    for file in checkpoint_dir.glob("checkpoint_*.brep"):
+        if file != path:
+            file.unlink()
+
+
+def _latest_checkpoint(
+    checkpoint_dir: Path, key: str
+) -> tuple[cq.Shape, int, int] | None:
+    checkpoints: list[tuple[int, int, Path]] = []
+    for file in checkpoint_dir.glob("checkpoint_*.brep"):
+        parts: list[str] = file.stem.split("_")
+        if len(parts) != 4 or parts[1] != key:
+            raise ValueError(
+                f"Cannot resume from {file}. It was cut for different gear or "
+                "rack parameters; remove it or run without resume"
+            )
+        checkpoints.append((int(parts[2]), int(parts[3]), file))
+    if len(checkpoints) == 0:
+        return None
+    position, cut_counter, file = max(checkpoints)
+    return cq.Shape.importBrep(str(file)), position, cut_counter
+
+
+def hobbing_envelope(
+    geardata: GearData,
+    points: np.ndarray,
+    num_cut_positions: int = 5000,
+    n_arc_points: int = 16,
+    chunk_size: int = 256,
+) -> np.ndarray:
+    # 2D reference for the transverse profile that simulate_gear_cutting
+    # generates: the rack outline is moved to every rack position at once and
+    # the profile radius is the nearest rack crossing along the ray from the
+    # gear axis through each of the given (2, N) points. The generated gear is
+    # z-periodic, so every point is evaluated against the tooth centred on +x.
+    # Where the rack undercuts a flank, a ray may cross the profile more than
+    # once and the crossing nearest to the axis is returned.
+    m: float = geardata.m_t
+    z: int = geardata.z
+    p: float = geardata.p
+    r: float = geardata.d / 2
+    r_blank: float = r + 1.5 * m
+
+    psi: np.ndarray = np.arctan2(points[1], points[0])
+    psi_tooth: np.ndarray = psi - 2 * np.pi / z * np.round(psi * z / (2 * np.pi))
+    order: np.ndarray = np.argsort(psi_tooth)
+    psi_sorted: np.ndarray = psi_tooth[order]
+    u: np.ndarray = np.vstack([np.cos(psi_sorted), np.sin(psi_sorted)])
+
+    # rack positions, and the rack teeth at each, that reach into the blank
+    start, end = rack_period_segments(geardata, n_arc_points)
+    reach: float = float(np.sqrt(r_blank**2 - (r - geardata.ha) ** 2)) + p
+    n_teeth: int = int(np.ceil(2 * reach / p))
+    shifts: np.ndarray = p * np.arange(-n_teeth, n_teeth + 1)
+    start = np.hstack([start + np.array([[shift], [0.0]]) for shift in shifts])
+    end = np.hstack([end + np.array([[shift], [0.0]]) for shift in shifts])
+    step: float = p * z / num_cut_positions
+    n_steps: int = int(np.ceil(reach / step))
+    x_rack: np.ndarray = step * np.arange(-n_steps, n_steps + 1)
+
+    rho: np.ndarray = np.full(psi_sorted.size, r_blank)
+    for chunk_start in range(0, x_rack.size, chunk_size):
+        x_chunk: np.ndarray = x_rack[chunk_start : chunk_start + chunk_size, None]
+        # rack frame -> gear frame, rotated by pi/2 so the tooth lies on +x
+        angle: np.ndarray = np.pi / 2 + x_chunk / r
+        cos_a: np.ndarray = np.cos(angle)
+        sin_a: np.ndarray = np.sin(angle)
+        ax: np.ndarray = start[0] - x_chunk
+        ay: np.ndarray = start[1] - r
+        bx: np.ndarray = end[0] - x_chunk
+        by: np.ndarray = end[1] - r
+        a: np.ndarray = np.stack(
+            [cos_a * ax - sin_a * ay, sin_a * ax + cos_a * ay]
+        ).reshape(2, -1)
+        b: np.ndarray = np.stack(
+            [cos_a * bx - sin_a * by, sin_a * bx + cos_a * by]
+        ).reshape(2, -1)
+
+        # query rays within the angular span of each segment
+        psi_a: np.ndarray = np.arctan2(a[1], a[0])
+        psi_b: np.ndarray = np.arctan2(b[1], b[0])
+        lo: np.ndarray = np.searchsorted(psi_sorted, np.minimum(psi_a, psi_b))
+        hi: np.ndarray = np.searchsorted(
+            psi_sorted, np.maximum(psi_a, psi_b), side="right"
+        )
+        counts: np.ndarray = hi - lo
+        segment: np.ndarray = np.repeat(np.arange(counts.size), counts)
+        if segment.size == 0:
+            continue
+        ray: np.ndarray = (
+            np.arange(segment.size)
+            - np.repeat(np.cumsum(counts) - counts, counts)
+            + lo[segment]
+        )
+
+        # ray-segment intersection a + t (b - a) = rho u
+        seg_a: np.ndarray = a[:, segment]
+        seg_d: np.ndarray = b[:, segment] - seg_a
+        ray_u: np.ndarray = u[:, ray]
+        denom: np.ndarray = ray_u[0] * seg_d[1] - ray_u[1] * seg_d[0]
+        valid: np.ndarray = np.abs(denom) > 1e-12
+        hit: np.ndarray = (seg_a[0] * seg_d[1] - seg_a[1] * seg_d[0])[valid] / denom[
+            valid
+        ]
+        np.minimum.at(rho, ray[valid][hit > 0], hit[hit > 0])
+
+    envelope: np.ndarray = np.empty((2, psi.size))
+    envelope[:, order] = rho * np.vstack([np.cos(psi_sorted), np.sin(psi_sorted)])
+    # back onto the tooth the points belong to
+    turn: np.ndarray = psi - psi_tooth
+    return np.vstack(
+        [
+            np.cos(turn) * envelope[0] - np.sin(turn) * envelope[1],
+            np.sin(turn) * envelope[0] + np.cos(turn) * envelope[1],
+        ]
+    )
 
 
 def simulate_gear_cutting(
@@ -13,13 +266,59 @@ def simulate_gear_cutting(
     num_cut_positions: int,
     visualize: Literal[None, "show", "step", "img"],
     gear_index: int,
+    mode: HobbingMode = "sequential",
+    checkpoint_every: int | None = None,
+    resume: bool = False,
+    placements: list[gp_Trsf] | None = None,
+    render_queue: RenderQueue | None = None,
+    rack_mesh: RigidMesh | None = None,
+    video_length: float | None = None,
 ) -> cq.Workplane:
+    # checkpoint_every writes the partially cut blank (or profile) to
+    # output/checkpoint/ every that many rack positions and once at the end.
+    # resume restarts from the latest checkpoint of the same mode and
+    # num_cut_positions, if there is one, and raises if that checkpoint was
+    # cut for different gear or rack parameters. placements are the rack
+    # positions from rack_placements, computed here unless given. With
+    # render_queue, img frames are rendered asynchronously and the caller
+    # closes the queue.
+    # rack_mesh is the tessellated rack for img frames, computed here unless
+    # given; every frame only moves its vertices. video_length (in seconds)
+    # streams the img frames into output/video/<gear_index>.mp4 instead of
+    # writing PNG files. In sector mode the frames show only the extruded
+    # one-pitch sector, at the positions whose rack reaches it, so its videos
+    # are short clips of a wedge; transverse mode animates the whole gear.
 
+    if video_length is not None and (visualize != "img" or resume):
+        raise ValueError("video_length requires visualize='img' and no resume")
+    if video_length is not None and video_length <= 0:
+        raise ValueError(f"video_length must be positive. Instead got {video_length}")
+    if checkpoint_every is not None and checkpoint_every < 1:
+        raise ValueError(
+            f"checkpoint_every must be positive. Instead got {checkpoint_every}"
+        )
     if gear.rack is None:
         raise ValueError(
             "Could not simulate gear cutting. No rack found in gear (None value)"
         )
     rack: cq.Workplane = gear.rack
+    if placements is None:
+        placements = rack_placements(
+            rack_transforms(gear.data, num_cut_positions, mode)
+        )
+    if len(placements) != num_cut_positions:
+        raise ValueError(
+            f"Expected {num_cut_positions} rack placements, got {len(placements)}"
+        )
+    # the rack is shown rolling past the blank, also in sector mode, where the
+    # cutting placements jump back by one pitch every period
+    display_placements: list[gp_Trsf] = placements
+    if mode == "sector" and visualize is not None:
+        display_placements = rack_placements(
+            rack_transforms(gear.data, num_cut_positions, "sequential")
+        )
+    if visualize == "img" and rack_mesh is None:
+        rack_mesh = RigidMesh(rack)
 
     m: float = gear.data.m_t
     z: float = gear.data.z
@@ -39,44 +338,175 @@ def simulate_gear_cutting(
     step_dir: Path = output_dir / "step" / gear_subdir
     image_dir: Path = output_dir / "img" / gear_subdir
     tmp_dir: Path = output_dir / "tmp" / gear_subdir
-
-    fixed_camera_position: pv.CameraPosition | None = setup_visualization(
-        visualize, step_dir, image_dir, tmp_dir, gear_blank
+    checkpoint_dir: Path = (
+        output_dir / "checkpoint" / gear_subdir / f"{mode}_{num_cut_positions}"
     )
 
-    result: cq.Workplane = gear_blank
-    result.faces("|Z").tag("axis")
-    cut_counter = visualize_step(
-        result,
-        None,
-        visualize,
-        cut_counter,
-        step_dir,
-        image_dir,
-        tmp_dir,
-        fixed_camera_position,
+    checkpoint_key: str = _checkpoint_key(gear)
+
+    checkpoint: tuple[cq.Shape, int, int] | None = (
+        _latest_checkpoint(checkpoint_dir, checkpoint_key) if resume else None
+    )
+    renderer: FrameRenderer | None = setup_visualization(
+        visualize, step_dir, image_dir, tmp_dir, gear_blank, clean=checkpoint is None
+    )
+    fixed_camera_position: pv.CameraPosition | None = (
+        None if renderer is None else renderer.camera_position
     )
 
-    for i in range(num_cut_positions):
-        t: float = i / (num_cut_positions)
-        x_rack: float = p * z * (1 / 2 - t)
-        theta: float = x_rack / r
+    # the encoder is closed even if cutting fails, so that ffmpeg does not
+    # wait on its input forever
+    encoder: FrameEncoder | None = None
+    try:
+        result: cq.Workplane = gear_blank
+        first_position: int = 0
+        if checkpoint is not None:
+            checkpoint_shape, first_position, cut_counter = checkpoint
+            if mode == "sequential":
+                result = cq.Workplane().add(checkpoint_shape)
+            print(f"Resuming gear {gear_index} at position {first_position}")
+        result.faces("|Z").tag("axis")
 
-        positioned_rack: cq.Workplane = rack.translate((-x_rack, -r, 0.0)).rotate(
-            (0, 0, 0), (0, 0, 1), np.degrees(theta)
-        )
+        rack_section: cq.Shape | None = None
+        profile: cq.Shape | None = None
+        if mode == "transverse":
+            rack_section = rack.section(0.0).val()  # type: ignore
+            profile = cq.Face.makeFromWires(
+                cq.Wire.makeCircle(d_blank / 2, cq.Vector(), cq.Vector(0, 0, 1))
+            )
+        elif mode == "sector":
+            if num_cut_positions % z != 0:
+                raise ValueError(
+                    "num_cut_positions must be a multiple of z in sector mode so that "
+                    f"every tooth space is cut alike. Instead got {num_cut_positions}"
+                )
+            rack_section = _short_rack_section(
+                rack.section(0.0).val(), p, r, d_blank / 2  # type: ignore
+            )
+            # one tooth pitch centred on the rack contact point of position 0
+            profile = _sector_face(d_blank / 2, -np.pi / 2 - np.pi / z, 2 * np.pi / z)
+            sector_box: cq.BoundBox = profile.BoundingBox()
+        if checkpoint is not None and mode != "sequential":
+            profile = checkpoint[0]
 
-        result = result.cut(positioned_rack)
-        cut_counter = visualize_step(
-            result,
-            positioned_rack,
-            visualize,
-            cut_counter,
-            step_dir,
-            image_dir,
-            tmp_dir,
-            fixed_camera_position,
-        )
+        if video_length is not None:
+            n_frames: int = 1 + num_cut_positions
+            if mode == "sector":
+                # only the positions that reach the sector are rendered
+                n_frames = 1 + sum(
+                    _boxes_overlap(
+                        _place(rack_section, placement).BoundingBox(),  # type: ignore
+                        sector_box,
+                    )
+                    for placement in placements
+                )
+            encoder = FrameEncoder(
+                output_dir / "video" / f"{gear_subdir}.mp4", n_frames / video_length
+            )
+
+        if checkpoint is None:
+            cut_counter = visualize_step(
+                result,
+                None,
+                visualize,
+                cut_counter,
+                step_dir,
+                image_dir,
+                tmp_dir,
+                fixed_camera_position,
+                render_queue,
+                renderer,
+                None,
+                encoder,
+            )
+
+        for i in range(first_position, num_cut_positions):
+            if (
+                checkpoint_every is not None
+                and i > first_position
+                and i % checkpoint_every == 0
+            ):
+                _write_checkpoint(
+                    checkpoint_dir,
+                    checkpoint_key,
+                    result.val() if mode == "sequential" else profile,  # type: ignore
+                    i,
+                    cut_counter,
+                )
+            placement: gp_Trsf = placements[i]
+
+            if mode in ("transverse", "sector"):
+                positioned_section: cq.Shape = _place(rack_section, placement)  # type: ignore
+                if mode == "sector" and not _boxes_overlap(
+                    positioned_section.BoundingBox(), sector_box
+                ):
+                    continue
+                profile = profile.cut(positioned_section)  # type: ignore
+                if visualize is None:
+                    continue
+                result = extrude_gear_profile(
+                    gear.data, cq.Sketch().face(profile.Faces()[0])  # type: ignore
+                )
+
+            # img frames only need the placed rack mesh, not the placed solid
+            display_placement: gp_Trsf = display_placements[i]
+            positioned_rack: cq.Workplane | None = None
+            if mode == "sequential" or visualize in ("show", "step"):
+                positioned_rack = cq.Workplane().add(
+                    _place(rack.val(), display_placement)  # type: ignore
+                )
+
+            if mode == "sequential":
+                result = result.cut(positioned_rack)  # type: ignore
+            cut_counter = visualize_step(
+                result,
+                positioned_rack,
+                visualize,
+                cut_counter,
+                step_dir,
+                image_dir,
+                tmp_dir,
+                fixed_camera_position,
+                render_queue,
+                renderer,
+                None if rack_mesh is None else rack_mesh.placed(display_placement),
+                encoder,
+            )
+
+        if checkpoint_every is not None and first_position < num_cut_positions:
+            _write_checkpoint(
+                checkpoint_dir,
+                checkpoint_key,
+                result.val() if mode == "sequential" else profile,  # type: ignore
+                num_cut_positions,
+                cut_counter,
+            )
+
+        if mode == "sector":
+            sector_faces: list[cq.Face] = profile.Faces()  # type: ignore
+            copies: list[cq.Shape] = [
+                face.rotate(cq.Vector(), cq.Vector(0, 0, 1), 360 * k / z)
+                for k in range(1, int(z))
+                for face in sector_faces
+            ]
+            # neighbouring sectors only share their radial edges
+            profile = (
+                sector_faces[0].fuse(*sector_faces[1:], *copies, glue=True).clean()
+            )
+
+        if mode in ("transverse", "sector"):
+            result = extrude_gear_profile(
+                gear.data, cq.Sketch().face(profile.Faces()[0])  # type: ignore
+            )
+    finally:
+        if encoder is not None:
+            try:
+                if render_queue is not None:
+                    render_queue.flush()
+            finally:
+                encoder.close()
+        if renderer is not None:
+            renderer.close()
 
     result.faces("|Z").tag("tooth_flanks")
     result.faces(">Z").tag("top_face")
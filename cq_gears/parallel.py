@@ -0,0 +1,79 @@
+import os
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .core import GearData
+
+# progress(completed_jobs, total_jobs), called in the parent process
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass
+class JobError:
+    index: int
+    gear_data: GearData
+    message: str
+
+
+def default_workers() -> int:
+    return max(1, os.cpu_count() or 1)
+
+
+def run_jobs(
+    job: Callable[..., Any],
+    job_args: list[tuple],
+    gear_data_list: list[GearData],
+    max_workers: int | None = None,
+    progress: ProgressCallback | None = None,
+) -> list[Any | JobError]:
+    """
+    Run ``job(*args)`` for every entry of job_args in a process pool.
+
+    Results are returned in input order. A job that raises yields a JobError
+    in its slot instead of aborting the other jobs. A worker that dies (for
+    example killed by the OS) breaks the whole pool, so every job that has not
+    finished by then yields a JobError with BrokenProcessPool.
+
+    Args:
+        job: Module-level (picklable) function executed in the workers
+        job_args: One argument tuple per job
+        gear_data_list: GearData belonging to each job, used for error reports
+        max_workers: Pool size, defaults to the number of CPUs
+        progress: Optional callback receiving (completed, total) after each job
+
+    Returns:
+        One result or JobError per job, in input order
+    """
+    if len(job_args) != len(gear_data_list):
+        raise ValueError(
+            f"got {len(job_args)} jobs but {len(gear_data_list)} GearData entries"
+        )
+
+    total: int = len(job_args)
+    results: list[Any | JobError] = [None] * total
+    if total == 0:
+        return results
+
+    n_workers: int = min(max_workers or default_workers(), total)
+    completed: int = 0
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures: dict[Future, int] = {
+            executor.submit(job, *args): i for i, args in enumerate(job_args)
+        }
+        for future in as_completed(futures):
+            i: int = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                message: str = "".join(
+                    traceback.format_exception(type(e), e, e.__traceback__)
+                )
+                results[i] = JobError(i, gear_data_list[i], message)
+            completed += 1
+            if progress is not None:
+                progress(completed, total)
+
+    return results
@@ -1,16 +1,109 @@
 import numpy as np
 import cadquery as cq
+from typing import Callable, Literal
 from . import geometry
 from . import cq_bridge
 
-from .core import GearData
+from .core import GearData, GearDataBatch
+from .cache import LRUMemo, MemoStats
+
+# "union": every tooth extruded separately and unioned with the root cylinder
+# "pattern": one tooth-plus-root-sector solid, rotated z times and sewn
+# "outline": the closed outline of all z teeth as one wire, extruded once
+GearConstruction = Literal["union", "pattern", "outline"]
+
+# "interpolate": OCC interpolates splines through the sampled flank points
+# "fit": B-splines fitted to the exact flanks in NumPy to within tolerance
+# are handed to OCC unchanged
+FlankCurves = Literal["interpolate", "fit"]
+
+# profile memos are shared by all gears with the same transverse profile,
+# e.g. face-width sweeps or left/right helix pairs
+_tooth_points_memo: LRUMemo = LRUMemo(maxsize=256)
+_tooth_sketch_memo: LRUMemo = LRUMemo(maxsize=64)
+
+
+def _profile_key(
+    geardata: GearData,
+    n_points: int | None,
+    tolerance: float | None = None,
+    flank_curves: FlankCurves = "interpolate",
+) -> tuple:
+    # every GearData field the 2D tooth profile depends on (b and the sign of
+    # beta do not enter it) plus the flank sampling
+    return (
+        float(geardata.m_t),
+        float(geardata.x),
+        float(geardata.alpha_n_r),
+        float(geardata.alpha_t_r),
+        float(geardata.d),
+        float(geardata.db),
+        float(geardata.da),
+        float(geardata.df),
+        n_points,
+        None if tolerance is None else float(tolerance),
+        flank_curves,
+    )
+
+
+def _check_flank_sampling(n_points: int | None, tolerance: float | None) -> None:
+    # flanks are sampled either with a fixed point count or adaptively until
+    # every chord stays within tolerance (in mm) of the exact curve
+    if (n_points is None) == (tolerance is None):
+        raise ValueError("Exactly one of n_points and tolerance must be given")
+    if n_points is not None and n_points < 3:
+        raise ValueError(f"n_points must be greater than 3. Instead got {n_points}")
+    if tolerance is not None and tolerance <= 0:
+        raise ValueError(f"tolerance must be positive. Instead got {tolerance}")
+
+
+def _flank_phi(
+    curve: Callable[[np.ndarray], np.ndarray],
+    phi_start_r: float,
+    phi_end_r: float,
+    n_points: int | None,
+    tolerance: float | None,
+) -> np.ndarray:
+    if tolerance is None:
+        return np.linspace(phi_start_r, phi_end_r, n_points)
+    return geometry.adaptive_phi(curve, phi_start_r, phi_end_r, tolerance)
+
+
+def profile_memo_stats() -> dict[str, MemoStats]:
+    return {
+        "tooth_points": _tooth_points_memo.stats(),
+        "tooth_sketch": _tooth_sketch_memo.stats(),
+    }
+
+
+def clear_profile_memos() -> None:
+    _tooth_points_memo.clear()
+    _tooth_sketch_memo.clear()
 
 
 def _compute_tooth_points(
-    geardata: GearData, n_points: int
+    geardata: GearData,
+    n_points: int | None,
+    tolerance: float | None = None,
+    flank_curves: FlankCurves = "interpolate",
 ) -> dict[str, bool | np.ndarray]:
-    if n_points < 3:
-        raise ValueError(f"n_points must be greater than 3. Instead got {n_points}")
+    # the memoized arrays are shared and therefore read-only
+    result: dict[str, bool | np.ndarray] = _tooth_points_memo.get_or_compute(
+        _profile_key(geardata, n_points, tolerance, flank_curves),
+        lambda: _compute_tooth_points_uncached(geardata, n_points, tolerance, flank_curves),
+    )
+    return dict(result)
+
+
+def _compute_tooth_points_uncached(
+    geardata: GearData,
+    n_points: int | None,
+    tolerance: float | None = None,
+    flank_curves: FlankCurves = "interpolate",
+) -> dict[str, bool | np.ndarray]:
+    _check_flank_sampling(n_points, tolerance)
+    if flank_curves == "fit" and tolerance is None:
+        raise ValueError("flank_curves='fit' needs a tolerance")
 
     phi_r_addendum: float = geometry.involute_phi_d(geardata.da, geardata.db, "right")
     phi_r_addendum_intersection: float = geometry.involute_self_intersection(
@@ -33,7 +126,6 @@ def _compute_tooth_points(
         geardata.db,
         geardata.alpha_t_r,
         "right",
-        200,
     )
 
     phi_r_end: float
@@ -45,50 +137,138 @@ def _compute_tooth_points(
         phi_r_end = phi_r_addendum
         involutes_instersect = False
 
-    points_inv_right: np.ndarray = geometry.involute_tooth(
+    def inv_curve(phi_r: np.ndarray) -> np.ndarray:
+        return geometry.involute_positioned(
+            geardata.m_t,
+            geardata.x,
+            geardata.d,
+            geardata.db,
+            geardata.alpha_n_r,
+            phi_r,
+            "right",
+        )
+
+    def undercut_curve(phi_r: np.ndarray) -> np.ndarray:
+        return geometry.undercut_curve_positioned(
+            geardata.m_t,
+            geardata.x,
+            geardata.df,
+            geardata.d,
+            geardata.db,
+            geardata.alpha_n_r,
+            geardata.alpha_t_r,
+            phi_r,
+            "right",
+        )
+
+    def undercut_derivative(phi_r: np.ndarray) -> np.ndarray:
+        return geometry.undercut_curve_positioned_derivative(
+            geardata.m_t,
+            geardata.x,
+            geardata.df,
+            geardata.d,
+            geardata.db,
+            geardata.alpha_n_r,
+            geardata.alpha_t_r,
+            phi_r,
+            "right",
+        )
+
+    phi_undercut_start: float = geometry.undercut_phi_0(
+        geardata.d, geardata.df, geardata.alpha_t_r, "right"
+    )
+    phi_inv_right: np.ndarray = _flank_phi(
+        inv_curve, phi_inv_start, phi_r_end, n_points, tolerance
+    )
+    phi_undercut_right: np.ndarray = _flank_phi(
+        undercut_curve, phi_undercut_start, phi_undercut_end, n_points, tolerance
+    )
+    # the left flanks are the mirror images of the right ones
+    phi_inv_left: np.ndarray = -phi_inv_right
+    phi_undercut_left: np.ndarray = -phi_undercut_right
+
+    points_inv_right: np.ndarray = geometry.involute_positioned(
         geardata.m_t,
         geardata.x,
         geardata.d,
         geardata.db,
         geardata.alpha_n_r,
-        phi_inv_start,
-        phi_r_end,
-        n_points,
+        phi_inv_right,
         "right",
     )
-    points_inv_left: np.ndarray = geometry.involute_tooth(
+    points_inv_left: np.ndarray = geometry.involute_positioned(
         geardata.m_t,
         geardata.x,
         geardata.d,
         geardata.db,
         geardata.alpha_n_r,
-        -phi_inv_start,
-        -phi_r_end,
-        n_points,
+        phi_inv_left,
         "left",
     )
-    points_undercut_right: np.ndarray = geometry.undercut_tooth(
+    points_undercut_right: np.ndarray = geometry.undercut_curve_positioned(
         geardata.m_t,
         geardata.x,
+        geardata.df,
         geardata.d,
         geardata.db,
+        geardata.alpha_n_r,
+        geardata.alpha_t_r,
+        phi_undercut_right,
+        "right",
+    )
+    points_undercut_left: np.ndarray = geometry.undercut_curve_positioned(
+        geardata.m_t,
+        geardata.x,
         geardata.df,
+        geardata.d,
+        geardata.db,
         geardata.alpha_n_r,
         geardata.alpha_t_r,
-        phi_undercut_end,
-        n_points,
+        phi_undercut_left,
+        "left",
+    )
+
+    # exact d/dphi at both flank ends, the splines are parametrized by phi
+    tangents_inv_right: np.ndarray = geometry.involute_positioned_derivative(
+        geardata.m_t,
+        geardata.x,
+        geardata.d,
+        geardata.db,
+        geardata.alpha_n_r,
+        phi_inv_right[[0, -1]],
         "right",
     )
-    points_undercut_left: np.ndarray = geometry.undercut_tooth(
+    tangents_inv_left: np.ndarray = geometry.involute_positioned_derivative(
         geardata.m_t,
         geardata.x,
         geardata.d,
         geardata.db,
+        geardata.alpha_n_r,
+        phi_inv_left[[0, -1]],
+        "left",
+    )
+    tangents_undercut_right: np.ndarray = (
+        geometry.undercut_curve_positioned_derivative(
+            geardata.m_t,
+            geardata.x,
+            geardata.df,
+            geardata.d,
+            geardata.db,
+            geardata.alpha_n_r,
+            geardata.alpha_t_r,
+            phi_undercut_right[[0, -1]],
+            "right",
+        )
+    )
+    tangents_undercut_left: np.ndarray = geometry.undercut_curve_positioned_derivative(
+        geardata.m_t,
+        geardata.x,
         geardata.df,
+        geardata.d,
+        geardata.db,
         geardata.alpha_n_r,
         geardata.alpha_t_r,
-        -phi_undercut_end,
-        n_points,
+        phi_undercut_left[[0, -1]],
         "left",
     )
 
@@ -97,24 +277,291 @@ def _compute_tooth_points(
         "points_inv_left": points_inv_left,
         "points_undercut_right": points_undercut_right,
         "points_undercut_left": points_undercut_left,
+        "phi_inv_right": phi_inv_right,
+        "phi_inv_left": phi_inv_left,
+        "phi_undercut_right": phi_undercut_right,
+        "phi_undercut_left": phi_undercut_left,
+        "tangents_inv_right": tangents_inv_right,
+        "tangents_inv_left": tangents_inv_left,
+        "tangents_undercut_right": tangents_undercut_right,
+        "tangents_undercut_left": tangents_undercut_left,
         "involutes_intersect": involutes_instersect,
     }
+    if flank_curves == "fit":
+        # the left flanks are the right ones mirrored about the x axis
+        mirror: np.ndarray = np.array([[1.0], [-1.0]])
+        fit_inv_right: geometry.BSplineFit = geometry.fit_bspline(
+            inv_curve, phi_inv_start, phi_r_end, tolerance  # type: ignore
+        )
+        # the undercut starts tangent to the root circle, its spline must match
+        # that tangent to stay outside the root circle
+        fit_undercut_right: geometry.BSplineFit = geometry.fit_bspline(
+            undercut_curve,
+            phi_undercut_start,
+            phi_undercut_end,
+            tolerance,  # type: ignore
+            derivative=undercut_derivative,
+        )
+        result["bspline_inv_right"] = fit_inv_right  # type: ignore
+        result["bspline_inv_left"] = fit_inv_right._replace(  # type: ignore
+            control_points=mirror * fit_inv_right.control_points
+        )
+        result["bspline_undercut_right"] = fit_undercut_right  # type: ignore
+        result["bspline_undercut_left"] = fit_undercut_right._replace(  # type: ignore
+            control_points=mirror * fit_undercut_right.control_points
+        )
+
+    for value in result.values():
+        arrays: tuple = value if isinstance(value, geometry.BSplineFit) else (value,)
+        for array in arrays:
+            if isinstance(array, np.ndarray):
+                array.flags.writeable = False
 
     return result
 
 
-def _tooth_sketch(geardata: GearData, n_points: int) -> cq.Sketch:
-    tooth_compute_dict: dict[str, bool | np.ndarray] = _compute_tooth_points(
-        geardata, n_points
+def compute_tooth_points_batch(
+    batch: GearDataBatch, n_points: int
+) -> dict[str, np.ndarray]:
+    # _compute_tooth_points for G gears at once, restricted to n_points evenly
+    # spaced samples per flank (no tolerance, no B-spline fits). Only the
+    # points and involutes_intersect are returned, none of the phi_* and
+    # tangents_* entries; changes to the flank limits must be made in both.
+    if n_points < 3:
+        raise ValueError(f"n_points must be greater than 3. Instead got {n_points}")
+
+    phi_r_addendum: np.ndarray = geometry.involute_phi_d(batch.da, batch.db, "right")
+    phi_r_addendum_intersection: np.ndarray = geometry.involute_self_intersection_batch(
+        phi_r_addendum,
+        batch.m_t,
+        batch.x,
+        batch.d,
+        batch.db,
+        batch.alpha_n_r,
+    ).phi
+    phi_inv_start: np.ndarray = geometry.involute_phi_d(batch.d, batch.db, "right")
+    phi_undercut_end: np.ndarray = geometry.undercut_phi_d(
+        batch.d, batch.d, batch.df, batch.alpha_t_r, "right"
+    )
+    intersection: geometry.UndercutIntersectionResult = (
+        geometry.undercut_involute_intersection_batch(
+            phi_inv_start,
+            phi_undercut_end,
+            batch.df,
+            batch.d,
+            batch.db,
+            batch.alpha_t_r,
+            "right",
+        )
+    )
+    phi_inv_start = intersection.phi_inv
+    phi_undercut_end = intersection.phi_undercut
+
+    involutes_intersect: np.ndarray = phi_r_addendum > phi_r_addendum_intersection
+    phi_r_end: np.ndarray = np.where(
+        involutes_intersect, phi_r_addendum_intersection, phi_r_addendum
+    )
+
+    points_inv_right: np.ndarray = geometry.involute_tooth_batch(
+        batch.m_t,
+        batch.x,
+        batch.d,
+        batch.db,
+        batch.alpha_n_r,
+        phi_inv_start,
+        phi_r_end,
+        n_points,
+        "right",
+    )
+    points_inv_left: np.ndarray = geometry.involute_tooth_batch(
+        batch.m_t,
+        batch.x,
+        batch.d,
+        batch.db,
+        batch.alpha_n_r,
+        -phi_inv_start,
+        -phi_r_end,
+        n_points,
+        "left",
+    )
+    points_undercut_right: np.ndarray = geometry.undercut_tooth_batch(
+        batch.m_t,
+        batch.x,
+        batch.d,
+        batch.db,
+        batch.df,
+        batch.alpha_n_r,
+        batch.alpha_t_r,
+        phi_undercut_end,
+        n_points,
+        "right",
+    )
+    points_undercut_left: np.ndarray = geometry.undercut_tooth_batch(
+        batch.m_t,
+        batch.x,
+        batch.d,
+        batch.db,
+        batch.df,
+        batch.alpha_n_r,
+        batch.alpha_t_r,
+        -phi_undercut_end,
+        n_points,
+        "left",
+    )
+
+    # every curve is stacked as (G, 2, N); involutes_intersect has shape (G,)
+    result: dict[str, np.ndarray] = {
+        "points_inv_right": points_inv_right,
+        "points_inv_left": points_inv_left,
+        "points_undercut_right": points_undercut_right,
+        "points_undercut_left": points_undercut_left,
+        "involutes_intersect": involutes_intersect,
+    }
+
+    return result
+
+
+def _tooth_sketch(
+    geardata: GearData,
+    n_points: int | None,
+    tolerance: float | None = None,
+    flank_curves: FlankCurves = "interpolate",
+) -> cq.Sketch:
+    return _tooth_sketch_memo.get_or_compute(
+        ("tooth", _profile_key(geardata, n_points, tolerance, flank_curves)),
+        lambda: _tooth_sketch_uncached(geardata, n_points, tolerance, flank_curves),
+    )
+
+
+def _tooth_sector_sketch(
+    geardata: GearData,
+    n_points: int | None,
+    tolerance: float | None = None,
+    flank_curves: FlankCurves = "interpolate",
+) -> cq.Sketch:
+    return _tooth_sketch_memo.get_or_compute(
+        ("sector", geardata.z, _profile_key(geardata, n_points, tolerance, flank_curves)),
+        lambda: _tooth_sector_sketch_uncached(geardata, n_points, tolerance, flank_curves),
+    )
+
+
+def _gear_outline_sketch(
+    geardata: GearData,
+    n_points: int | None,
+    tolerance: float | None = None,
+    flank_curves: FlankCurves = "interpolate",
+) -> cq.Sketch:
+    return _tooth_sketch_memo.get_or_compute(
+        ("outline", geardata.z, _profile_key(geardata, n_points, tolerance, flank_curves)),
+        lambda: cq.Sketch().face(_gear_outline_wire(geardata, n_points, tolerance, flank_curves)),
+    )
+
+
+def _flank_edge(
+    points: np.ndarray, tangents: np.ndarray, phi_r: np.ndarray
+) -> cq.Edge:
+    # an involute starting on the base circle has a vanishing derivative there,
+    # OCC cannot interpolate a zero tangent
+    if np.any(np.linalg.norm(tangents, axis=0) < 1e-12):
+        return cq_bridge.cq_spline_edge(points, parameters=phi_r)
+    return cq_bridge.cq_spline_edge(points, tangents, phi_r)
+
+
+def _flank_edges(
+    tooth_compute_dict: dict[str, bool | np.ndarray],
+    flank_name: Literal["inv_right", "inv_left", "undercut_right", "undercut_left"],
+    rotations: np.ndarray,
+) -> list[cq.Edge]:
+    # one edge per rotation, the left flanks are reversed so that every edge
+    # runs counter clockwise along the gear outline
+    reverse: bool = flank_name.endswith("left")
+    # with intersecting involutes the left flank ends on the right tip point
+    close_tip: bool = flank_name == "inv_left" and bool(
+        tooth_compute_dict["involutes_intersect"]
     )
+
+    fit: geometry.BSplineFit | None = tooth_compute_dict.get(  # type: ignore
+        f"bspline_{flank_name}"
+    )
+    if fit is not None:
+        if close_tip:
+            fit_right: geometry.BSplineFit = tooth_compute_dict["bspline_inv_right"]  # type: ignore
+            control_points: np.ndarray = fit.control_points.copy()
+            control_points[:, -1] = fit_right.control_points[:, -1]
+            fit = fit._replace(control_points=control_points)
+        if reverse:
+            fit = geometry.reverse_bspline(fit)
+        return [
+            cq_bridge.cq_bspline_edge(control_points, fit.knots, fit.degree)
+            for control_points in geometry.rotate_copies(fit.control_points, rotations)
+        ]
+
+    points: np.ndarray = tooth_compute_dict[f"points_{flank_name}"]  # type: ignore
+    tangents: np.ndarray = tooth_compute_dict[f"tangents_{flank_name}"]  # type: ignore
+    phi_r: np.ndarray = tooth_compute_dict[f"phi_{flank_name}"]  # type: ignore
+    if close_tip:
+        points = points.copy()
+        points[:, -1] = tooth_compute_dict["points_inv_right"][:, -1]  # type: ignore
+    if reverse:
+        points, tangents, phi_r = points[:, ::-1], tangents[:, ::-1], phi_r[::-1]
+    return [
+        _flank_edge(rotated_points, rotated_tangents, phi_r)
+        for rotated_points, rotated_tangents in zip(
+            geometry.rotate_copies(points, rotations),
+            geometry.rotate_copies(tangents, rotations),
+        )
+    ]
+
+
+def _add_tooth_flanks(
+    sketch: cq.Sketch, tooth_compute_dict: dict[str, bool | np.ndarray]
+) -> cq.Sketch:
+    # adds the tooth outline from the right root point to the left root point
     points_inv_right: np.ndarray = tooth_compute_dict["points_inv_right"]  # type: ignore
     points_inv_left: np.ndarray = tooth_compute_dict["points_inv_left"]  # type: ignore
-    points_undercut_right: np.ndarray = tooth_compute_dict["points_undercut_right"]  # type: ignore
-    points_undercut_left: np.ndarray = tooth_compute_dict["points_undercut_left"]  # type: ignore
     involutes_instersect: bool = tooth_compute_dict["involutes_intersect"]  # type: ignore
+    no_rotation: np.ndarray = np.zeros(1)
 
-    if involutes_instersect:
-        points_inv_left[:, -1] = points_inv_right[:, -1]
+    sketch = sketch.edge(
+        _flank_edges(tooth_compute_dict, "undercut_right", no_rotation)[0]
+    ).edge(_flank_edges(tooth_compute_dict, "inv_right", no_rotation)[0])
+    if not involutes_instersect:
+        arc_tip: cq_bridge.CqArcTuple = cq_bridge.cq_arc_center_start_end(
+            arc_center=np.array([0.0, 0.0]),
+            arc_start=points_inv_right[:, -1],
+            arc_end=points_inv_left[:, -1],
+            counter_clock_wise=True,
+        )
+        sketch = sketch.arc(*arc_tip)
+    return sketch.edge(
+        _flank_edges(tooth_compute_dict, "inv_left", no_rotation)[0]
+    ).edge(_flank_edges(tooth_compute_dict, "undercut_left", no_rotation)[0])
+
+
+def _check_sketch_face(sketch: cq.Sketch, geardata: GearData) -> cq.Sketch:
+    # a self-intersecting outline still assembles into a face, which the
+    # following booleans then get silently wrong
+    faces: list[cq.Face] = sketch._faces.Faces()
+    if len(faces) != 1 or not faces[0].isValid():
+        raise ValueError(
+            f"Could not build a valid tooth face for z={geardata.z}, "
+            f"x={geardata.x}. The flank curves intersect each other or the "
+            "root circle"
+        )
+    return sketch
+
+
+def _tooth_sketch_uncached(
+    geardata: GearData,
+    n_points: int | None,
+    tolerance: float | None = None,
+    flank_curves: FlankCurves = "interpolate",
+) -> cq.Sketch:
+    tooth_compute_dict: dict[str, bool | np.ndarray] = _compute_tooth_points(
+        geardata, n_points, tolerance, flank_curves
+    )
+    points_undercut_right: np.ndarray = tooth_compute_dict["points_undercut_right"]  # type: ignore
+    points_undercut_left: np.ndarray = tooth_compute_dict["points_undercut_left"]  # type: ignore
 
     arc_base: cq_bridge.CqArcTuple = cq_bridge.cq_arc_center_start_end(
         arc_center=np.array([0.0, 0.0]),
@@ -123,56 +570,212 @@ def _tooth_sketch(geardata: GearData, n_points: int) -> cq.Sketch:
         counter_clock_wise=False,
     )
 
-    cq_inv_right: cq_bridge.CqSplineTuple = cq_bridge.cq_spline_from_array(
-        points_inv_right, skip_first=False, tangents=None, periodic=False
+    result: cq.Sketch = _add_tooth_flanks(
+        cq.Sketch().arc(*arc_base), tooth_compute_dict
+    ).assemble()
+
+    return _check_sketch_face(result, geardata)
+
+
+def _tooth_sector_sketch_uncached(
+    geardata: GearData,
+    n_points: int | None,
+    tolerance: float | None = None,
+    flank_curves: FlankCurves = "interpolate",
+) -> cq.Sketch:
+    # one tooth plus the root sector of angle 2 pi / z it sits on, closed
+    # through the gear axis so that z rotated copies tile the whole gear
+    tooth_compute_dict: dict[str, bool | np.ndarray] = _compute_tooth_points(
+        geardata, n_points, tolerance, flank_curves
+    )
+    points_undercut_right: np.ndarray = tooth_compute_dict["points_undercut_right"]  # type: ignore
+    points_undercut_left: np.ndarray = tooth_compute_dict["points_undercut_left"]  # type: ignore
+
+    origin: np.ndarray = np.array([0.0, 0.0])
+    half_pitch_angle: float = np.pi / geardata.z
+    sector_start: np.ndarray = geometry.rotate(
+        np.array([[geardata.df / 2], [0.0]]), -half_pitch_angle
+    )[:, 0]
+    sector_end: np.ndarray = sector_start * np.array([1.0, -1.0])
+
+    arc_root_right: cq_bridge.CqArcTuple = cq_bridge.cq_arc_center_start_end(
+        arc_center=origin,
+        arc_start=sector_start,
+        arc_end=points_undercut_right[:, 0],
+        counter_clock_wise=True,
     )
-    cq_inv_left: cq_bridge.CqSplineTuple = cq_bridge.cq_spline_from_array(
-        points_inv_left[:, ::-1], skip_first=False, tangents=None, periodic=False
+    arc_root_left: cq_bridge.CqArcTuple = cq_bridge.cq_arc_center_start_end(
+        arc_center=origin,
+        arc_start=points_undercut_left[:, 0],
+        arc_end=sector_end,
+        counter_clock_wise=True,
     )
-    cq_undercut_right: cq_bridge.CqSplineTuple = cq_bridge.cq_spline_from_array(
-        points_undercut_right, skip_first=False, tangents=None, periodic=False
+
+    sketch: cq.Sketch = (
+        cq.Sketch().segment(tuple(origin), tuple(sector_start)).arc(*arc_root_right)
     )
-    cq_undercut_left: cq_bridge.CqSplineTuple = cq_bridge.cq_spline_from_array(
-        points_undercut_left[:, ::-1], skip_first=False, tangents=None, periodic=False
+    result: cq.Sketch = (
+        _add_tooth_flanks(sketch, tooth_compute_dict)
+        .arc(*arc_root_left)
+        .segment(tuple(sector_end), tuple(origin))
+        .assemble()
     )
 
-    result: cq.Sketch
+    return _check_sketch_face(result, geardata)
+
+
+def _gear_outline_wire(
+    geardata: GearData,
+    n_points: int | None,
+    tolerance: float | None = None,
+    flank_curves: FlankCurves = "interpolate",
+) -> cq.Wire:
+    tooth_compute_dict: dict[str, bool | np.ndarray] = _compute_tooth_points(
+        geardata, n_points, tolerance, flank_curves
+    )
+    points_inv_right: np.ndarray = tooth_compute_dict["points_inv_right"]  # type: ignore
+    points_inv_left: np.ndarray = tooth_compute_dict["points_inv_left"]  # type: ignore
+    points_undercut_right: np.ndarray = tooth_compute_dict["points_undercut_right"]  # type: ignore
+    points_undercut_left: np.ndarray = tooth_compute_dict["points_undercut_left"]  # type: ignore
+    involutes_instersect: bool = tooth_compute_dict["involutes_intersect"]  # type: ignore
+
     if involutes_instersect:
-        result = (
-            cq.Sketch()
-            .arc(*arc_base)
-            .spline(*cq_undercut_right)
-            .spline(*cq_inv_right)
-            .spline(*cq_inv_left)
-            .spline(*cq_undercut_left)
-            .assemble()
+        points_inv_left = points_inv_left.copy()
+        points_inv_left[:, -1] = points_inv_right[:, -1]
+
+    z: int = geardata.z
+    tooth_angles: np.ndarray = 2 * np.pi * np.arange(z) / z
+    inv_right: np.ndarray = geometry.rotate_copies(points_inv_right, tooth_angles)
+    inv_left: np.ndarray = geometry.rotate_copies(
+        points_inv_left[:, ::-1], tooth_angles
+    )
+    undercut_right: np.ndarray = geometry.rotate_copies(
+        points_undercut_right, tooth_angles
+    )
+    undercut_left: np.ndarray = geometry.rotate_copies(
+        points_undercut_left[:, ::-1], tooth_angles
+    )
+
+    # arc midpoints on the tooth centre line (tip) and between teeth (root)
+    r_tip: float = float(np.linalg.norm(points_inv_right[:, -1]))
+    tip_mid: np.ndarray = r_tip * np.vstack(
+        [np.cos(tooth_angles), np.sin(tooth_angles)]
+    )
+    root_angles: np.ndarray = tooth_angles + np.pi / z
+    root_mid: np.ndarray = (
+        geardata.df / 2 * np.vstack([np.cos(root_angles), np.sin(root_angles)])
+    )
+
+    edges_inv_right: list[cq.Edge] = _flank_edges(
+        tooth_compute_dict, "inv_right", tooth_angles
+    )
+    edges_inv_left: list[cq.Edge] = _flank_edges(
+        tooth_compute_dict, "inv_left", tooth_angles
+    )
+    edges_undercut_right: list[cq.Edge] = _flank_edges(
+        tooth_compute_dict, "undercut_right", tooth_angles
+    )
+    edges_undercut_left: list[cq.Edge] = _flank_edges(
+        tooth_compute_dict, "undercut_left", tooth_angles
+    )
+
+    edges: list[cq.Edge] = []
+    for k in range(z):
+        edges.append(edges_undercut_right[k])
+        edges.append(edges_inv_right[k])
+        if not involutes_instersect:
+            edges.append(
+                cq_bridge.cq_arc_edge(
+                    inv_right[k][:, -1], tip_mid[:, k], inv_left[k][:, 0]
+                )
+            )
+        edges.append(edges_inv_left[k])
+        edges.append(edges_undercut_left[k])
+        edges.append(
+            cq_bridge.cq_arc_edge(
+                undercut_left[k][:, -1],
+                root_mid[:, k],
+                undercut_right[(k + 1) % z][:, 0],
+            )
         )
-    else:
-        arc_tip: cq_bridge.CqArcTuple = cq_bridge.cq_arc_center_start_end(
-            arc_center=np.array([0.0, 0.0]),
-            arc_start=points_inv_right[:, -1],
-            arc_end=points_inv_left[:, -1],
-            counter_clock_wise=True,
+
+    return cq.Wire.assembleEdges(edges)
+
+
+def extrude_gear_profile(geardata: GearData, sketch: cq.Sketch) -> cq.Workplane:
+    if np.isclose(geardata.beta_r, 0.0):
+        # a single extrusion, both=True would fuse two half-width solids
+        return (
+            cq.Workplane()
+            .workplane(offset=-geardata.b / 2)
+            .placeSketch(sketch)
+            .extrude(geardata.b)
         )
-        result = (
-            cq.Sketch()
-            .arc(*arc_base)
-            .spline(*cq_undercut_right)
-            .spline(*cq_inv_right)
-            .arc(*arc_tip)
-            .spline(*cq_inv_left)
-            .spline(*cq_undercut_left)
-            .assemble()
+
+    twist_deg = np.degrees(2 * geardata.b * np.tan(geardata.beta_r) / geardata.d)
+    return (
+        cq.Workplane()
+        .workplane(offset=-geardata.b / 2)
+        .transformed(rotate=(0, 0, -twist_deg / 2))
+        .placeSketch(sketch)
+        .twistExtrude(geardata.b, twist_deg)
+    )
+
+
+def _is_axis_face(face: cq.Face, tol: float = 1e-6) -> bool:
+    # the faces swept by the radial sides of a sector contain the gear axis
+    for edge in face.Edges():
+        if all(abs(v.X) < tol and abs(v.Y) < tol for v in edge.Vertices()):
+            return True
+    return False
+
+
+def _pattern_gear_solid(
+    geardata: GearData,
+    n_points: int | None,
+    tolerance: float | None = None,
+    flank_curves: FlankCurves = "interpolate",
+) -> cq.Workplane:
+    sector_sketch: cq.Sketch = _tooth_sector_sketch(geardata, n_points, tolerance, flank_curves)
+
+    sector: cq.Workplane = extrude_gear_profile(geardata, sector_sketch)
+    sector_solid: cq.Shape = sector.val()  # type: ignore
+
+    # rigid copies only reference the sector geometry through a location
+    copies: list[cq.Shape] = [
+        sector_solid.moved(
+            cq.Location(cq.Vector(), cq.Vector(0, 0, 1), 360 * k / geardata.z)
         )
+        for k in range(geardata.z)
+    ]
+    # the radial sides of neighbouring sectors coincide, dropping them and
+    # sewing the remaining faces avoids a boolean fuse of z solids
+    gear_faces: list[cq.Face] = [
+        face for copy in copies for face in copy.Faces() if not _is_axis_face(face)
+    ]
+    gear_solid: cq.Shape = cq.Solid.makeSolid(cq.Shell.makeShell(gear_faces)).clean()
 
-    return result
+    return cq.Workplane().add(gear_solid)
 
 
-def parametric_gear_workplane(geardata: GearData, n_points: int) -> cq.Workplane:
+def parametric_gear_workplane(
+    geardata: GearData,
+    n_points: int | None = None,
+    construction: GearConstruction = "union",
+    tolerance: float | None = None,
+    flank_curves: FlankCurves = "interpolate",
+) -> cq.Workplane:
     if not np.isclose(geardata.delta_r, np.pi / 2):
         raise NotImplementedError("No bevel gear implemented in parametric_gear_workplane")
 
-    tooth_sketch: cq.Sketch = _tooth_sketch(geardata, n_points)
+    if construction == "pattern":
+        return _pattern_gear_solid(geardata, n_points, tolerance, flank_curves)
+    if construction == "outline":
+        return extrude_gear_profile(
+            geardata, _gear_outline_sketch(geardata, n_points, tolerance, flank_curves)
+        )
+
+    tooth_sketch: cq.Sketch = _tooth_sketch(geardata, n_points, tolerance, flank_curves)
 
     origin: cq.Workplane = cq.Workplane()
     cylinder: cq.Workplane = origin.cylinder(geardata.b, geardata.df / 2.0, (0, 0, 1))
@@ -1,45 +1,96 @@
+import io
 import numpy as np
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from matplotlib import pyplot as plt
+from matplotlib.artist import Artist
 from matplotlib.axes import Axes
-from matplotlib.patches import Circle, Rectangle, Arc
-import subprocess
-from typing import Literal
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.patches import Circle, FancyArrow, Rectangle, Arc
+from matplotlib.text import Text
+from typing import Callable, Literal
 from pathlib import Path
 
 from . import geometry
 from . import core
 from .core import GearData
-
-
-def ffmpeg_video(img_dir: Path, output_path: Path, name: str, framerate) -> None:
-    subprocess.run(
-        [
-            "ffmpeg",
-            "-y",
-            "-framerate",
-            str(framerate),
-            "-i",
-            str(img_dir / f"{name}_%03d.png"),
-            "-vf",
-            "scale=ceil(iw/2)*2:ceil(ih/2)*2",
-            "-c:v",
-            "libx264",
-            "-preset",
-            "medium",
-            "-profile:v",
-            "baseline",
-            "-level",
-            "3.0",
-            "-pix_fmt",
-            "yuv420p",
-            str(output_path),
-        ],
-        check=True,
-    )
-
-    for f in img_dir.iterdir():
-        f.unlink()
-    img_dir.rmdir()
+from .parallel import default_workers
+from .video import FrameEncoder
+
+
+def _figure_rgb(fig: Figure, dpi: float) -> np.ndarray:
+    # the figure as savefig(dpi=dpi) renders it, as a (height, width, 4) RGBA
+    # array instead of an encoded PNG
+    buffer: io.BytesIO = io.BytesIO()
+    fig.savefig(buffer, format="rgba", dpi=dpi)
+    width: int = int(fig.get_figwidth() * dpi)
+    height: int = int(fig.get_figheight() * dpi)
+    return np.frombuffer(buffer.getvalue(), dtype=np.uint8).reshape(height, width, 4)
+
+
+_ARROW_HEAD_LENGTH: float = 0.2
+
+
+def _agg_axes(dpi: float = 100) -> tuple[Figure, Axes]:
+    # a figure drawn by Agg alone, without pyplot or a display
+    fig: Figure = Figure(figsize=(5, 5), dpi=dpi)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+
+class _BlitFrames:
+    # frames of an Agg figure by blitting: the static artists are rendered
+    # once into a saved background, every frame restores it and draws only
+    # the animated artists, which must lie above all static ones
+    def __init__(self, fig: Figure, artists: list[Artist]) -> None:
+        self.fig: Figure = fig
+        self.artists: list[Artist] = sorted(artists, key=lambda a: a.get_zorder())
+        for artist in self.artists:
+            artist.set_animated(True)
+        self._background = None
+
+    def frame(self) -> np.ndarray:
+        canvas: FigureCanvasAgg = self.fig.canvas  # type: ignore
+        if self._background is None:
+            canvas.draw()
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        else:
+            canvas.restore_region(self._background)
+        for artist in self.artists:
+            self.fig.draw_artist(artist)
+        return np.asarray(canvas.buffer_rgba())[:, :, :3].copy()
+
+
+def _encode_in_pool(
+    frame_job: Callable[..., list[np.ndarray]],
+    chunk_args: list[tuple],
+    encoder: FrameEncoder,
+    max_workers: int | None,
+) -> None:
+    # frame_job(*args) renders one chunk of frames in a worker process; the
+    # chunks reach the encoder in order. At most two chunks per worker are
+    # rendered or waiting in memory at a time.
+    n_workers: int = min(max_workers or default_workers(), len(chunk_args))
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(n_workers) as executor:
+        try:
+            for args in chunk_args:
+                if len(pending) >= 2 * n_workers:
+                    for frame in pending.popleft().result():
+                        encoder.write(frame)
+                pending.append(executor.submit(frame_job, *args))
+            while pending:
+                for frame in pending.popleft().result():
+                    encoder.write(frame)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _chunks(values: np.ndarray, chunk_size: int) -> list[np.ndarray]:
+    return [values[i : i + chunk_size] for i in range(0, len(values), chunk_size)]
 
 
 def add_background_rect(
@@ -68,32 +119,32 @@ def add_background_rect(
     return ax
 
 
-def _plot_arrow(
-    ax: Axes, x1: float, y1: float, x2: float, y2: float, color, zorder: int
-) -> Axes:
-    head_length: float = 0.2
-    dx: float = x2 - x1
-    dy: float = y2 - y1
-    length: float = np.sqrt(dx**2 + dy**2)
-    if length == 0:
-        return ax
-    scale: float = 1 - head_length / length
-    dx: float = scale * dx
-    dy: float = scale * dy
-    ax.arrow(
-        x=x1,
-        y=y1,
-        dx=dx,
-        dy=dy,
+def _add_arrow(ax: Axes, color, zorder: int) -> FancyArrow:
+    # an arrow without length, placed by _move_arrow
+    return ax.arrow(
+        x=0.0,
+        y=0.0,
+        dx=0.0,
+        dy=0.0,
         width=0.04,
         head_width=0.1,
-        head_length=head_length,
+        head_length=_ARROW_HEAD_LENGTH,
         color=color,
         alpha=0.5,
         zorder=zorder,
     )
 
-    return ax
+
+def _move_arrow(arrow: FancyArrow, x1: float, y1: float, x2: float, y2: float) -> None:
+    # the head ends at (x2, y2); an arrow without length is hidden
+    dx: float = x2 - x1
+    dy: float = y2 - y1
+    length: float = np.sqrt(dx**2 + dy**2)
+    arrow.set_visible(bool(length != 0))
+    if length == 0:
+        return
+    scale: float = 1 - _ARROW_HEAD_LENGTH / length
+    arrow.set_data(x=x1, y=y1, dx=scale * dx, dy=scale * dy)
 
 
 def _arc_points(
@@ -192,6 +243,207 @@ def involute_plot_compute(
     return result
 
 
+class InvoluteAnimation:
+    """
+    Animated involute_plot that updates its artists instead of rebuilding them.
+
+    The base circle, background and limits are created once. Every update
+    only sets the data of the lines, marker, arrows, angle arc and label, so
+    a frame costs a few array updates instead of clearing and redrawing the
+    axes. A single update gives the same figure as involute_plot.
+
+    Args:
+        ax: Axes to draw on
+        phi_0: Start angle of the involute in degrees
+        show_arrows: Draw the radius and string arrows
+        show_angle: Draw the angle phi with its label
+        type: Construct the involute with an unrolling "string" or a rolling
+            "line"
+        phi_max: Largest phi of the animation, sets the rolling line length
+            (defaults to the phi of each update)
+    """
+
+    def __init__(
+        self,
+        ax: Axes,
+        phi_0: float,
+        show_arrows: bool,
+        show_angle: bool,
+        type: Literal["string", "line"],
+        phi_max: float | None = None,
+    ) -> None:
+        self.ax: Axes = ax
+        self.phi_0: float = phi_0
+        self.phi_max: float | None = phi_max
+        self.r: float = 1.0
+        lw: float = 3.0
+        r: float = self.r
+
+        zorder: int = 100
+
+        circle = Circle((0, 0), r, color="gray", alpha=1, zorder=zorder)
+        zorder += 1
+        ax.add_patch(circle)
+
+        self._string: Line2D | None = None
+        self._line_end: Line2D | None = None
+        self._line_start: Line2D | None = None
+        self._marker: Circle | None = None
+        if type == "string":
+            (self._string,) = ax.plot(
+                [], [], color="red", lw=lw, ls="--", zorder=zorder
+            )
+            zorder += 1
+        else:
+            (self._line_end,) = ax.plot(
+                [], [], color="red", lw=lw, ls="--", zorder=zorder
+            )
+            zorder += 1
+            (self._line_start,) = ax.plot(
+                [], [], color="red", lw=lw, ls="--", zorder=zorder
+            )
+            zorder += 1
+            self._marker = Circle((0, 0), 0.04, color="yellow", alpha=1, zorder=zorder)
+            zorder += 1
+            ax.add_patch(self._marker)
+
+        (self._involute,) = ax.plot(
+            [], [], color="white", linewidth=lw, zorder=zorder
+        )
+        zorder += 1
+
+        self._angle_lines: Line2D | None = None
+        self._angle_arc: Arc | None = None
+        self._angle_label: Text | None = None
+        if show_angle:
+            (self._angle_lines,) = ax.plot(
+                [], [], color="white", linewidth=lw / 3, zorder=zorder
+            )
+            zorder += 1
+            self._angle_arc = Arc(
+                (0, 0),
+                width=r / 2,
+                height=r / 2,
+                theta1=0.0,
+                theta2=0.0,
+                color="white",
+                lw=lw / 3,
+                alpha=1.0,
+                zorder=zorder,
+            )
+            zorder += 1
+            ax.add_patch(self._angle_arc)
+            self._angle_label = ax.text(
+                0.0,
+                0.0,
+                r"$\phi$",
+                color="white",
+                fontsize=14,
+                ha="center",
+                va="center",
+                zorder=zorder,
+            )
+            zorder += 1
+
+        self._radius_arrow: FancyArrow | None = None
+        self._string_arrow: FancyArrow | None = None
+        if show_arrows:
+            self._radius_arrow = _add_arrow(ax, "yellow", zorder)
+            zorder += 1
+            self._string_arrow = _add_arrow(ax, "blue", zorder)
+            zorder += 1
+
+        ax.set_aspect("equal")
+        ax.set_xlim(-1.5 * r, 3 * r)
+        ax.set_ylim(-1.5 * r, 3 * r)
+        add_background_rect(ax, (-1.5 * r, 3 * r), (-1.5 * r, 3 * r))
+        ax.set_position((0, 0, 1, 1))
+        ax.set_axis_off()
+
+        # everything that moves, all of it above the static artists
+        self.artists: list[Artist] = [
+            artist
+            for artist in (
+                self._string,
+                self._line_end,
+                self._line_start,
+                self._marker,
+                self._involute,
+                self._angle_lines,
+                self._angle_arc,
+                self._angle_label,
+                self._radius_arrow,
+                self._string_arrow,
+            )
+            if artist is not None
+        ]
+
+    def update(self, phi: float) -> list[Artist]:
+        """
+        Move the artists to the involute angle phi.
+
+        Args:
+            phi: Involute angle in degrees
+
+        Returns:
+            The moving artists, e.g. for blitting
+        """
+        r: float = self.r
+        involute_dict: dict[str, np.ndarray] = involute_plot_compute(
+            r=r,
+            phi_0=self.phi_0,
+            phi=phi,
+            rotate=0.0,
+            phi_max=self.phi_max,
+        )
+        contact: np.ndarray = involute_dict["rolling_line_contact"][:, 0]
+        rolling_inv: np.ndarray = involute_dict["rolling_line_inv"][:, 0]
+
+        if self._string is not None:
+            self._string.set_data(
+                involute_dict["unrolling_string"][0, :],
+                involute_dict["unrolling_string"][1, :],
+            )
+        if self._line_end is not None:
+            end: np.ndarray = involute_dict["rolling_line_end"][:, 0]
+            self._line_end.set_data(
+                [rolling_inv[0], end[0]], [rolling_inv[1], end[1]]
+            )
+        if self._line_start is not None:
+            start: np.ndarray = involute_dict["rolling_line_start"][:, 0]
+            self._line_start.set_data(
+                [rolling_inv[0], start[0]], [rolling_inv[1], start[1]]
+            )
+        if self._marker is not None:
+            self._marker.set_center((rolling_inv[0], rolling_inv[1]))
+
+        self._involute.set_data(
+            involute_dict["points_inv"][0, :], involute_dict["points_inv"][1, :]
+        )
+
+        if self._angle_lines is not None:
+            self._angle_lines.set_data([r, 0, contact[0]], [0, 0, contact[1]])
+        if self._angle_arc is not None:
+            self._angle_arc.theta2 = phi
+            self._angle_arc.stale = True
+        if self._angle_label is not None:
+            mid_angle_rad: float = np.radians(phi / 2)
+            text_radius: float = r / 2.5
+            self._angle_label.set_position(
+                (text_radius * np.cos(mid_angle_rad), text_radius * np.sin(mid_angle_rad))
+            )
+
+        if self._radius_arrow is not None:
+            _move_arrow(self._radius_arrow, 0.0, 0.0, contact[0], contact[1])
+        if self._string_arrow is not None:
+            inv_end: np.ndarray = involute_dict["inv_end"][:, 0]
+            _move_arrow(
+                self._string_arrow, contact[0], contact[1], inv_end[0], inv_end[1]
+            )
+
+        return self.artists
+
+
 def involute_plot(
     ax: Axes,
     phi_0: float,
@@ -201,201 +453,81 @@ def involute_plot(
     type: Literal["string", "line"],
     phi_max: float | None = None,
 ) -> Axes:
-    lw: float = 3.0
-    r: float = 1.0
-
-    involute_dict: dict[str, np.ndarray] = involute_plot_compute(
-        r=r,
-        phi_0=phi_0,
-        phi=phi,
-        rotate=0.0,
-        phi_max=phi_max,
-    )
-
-    zorder: int = 100
+    InvoluteAnimation(ax, phi_0, show_arrows, show_angle, type, phi_max).update(phi)
+    return ax
 
-    circle = Circle((0, 0), r, color="gray", alpha=1, zorder=zorder)
-    zorder += 1
-    ax.add_patch(circle)
 
-    if type == "string":
-        ax.plot(
-            involute_dict["unrolling_string"][0, :],
-            involute_dict["unrolling_string"][1, :],
-            color="red",
-            lw=lw,
-            ls="--",
-            zorder=zorder,
-        )
-        zorder += 1
-    else:
-        ax.plot(
-            [
-                involute_dict["rolling_line_inv"][0, 0],
-                involute_dict["rolling_line_end"][0, 0],
-            ],
-            [
-                involute_dict["rolling_line_inv"][1, 0],
-                involute_dict["rolling_line_end"][1, 0],
-            ],
-            color="red",
-            lw=lw,
-            ls="--",
-            zorder=zorder,
-        )
-        zorder += 1
-        ax.plot(
-            [
-                involute_dict["rolling_line_inv"][0, 0],
-                involute_dict["rolling_line_start"][0, 0],
-            ],
-            [
-                involute_dict["rolling_line_inv"][1, 0],
-                involute_dict["rolling_line_start"][1, 0],
-            ],
-            color="red",
-            lw=lw,
-            ls="--",
-            zorder=zorder,
-        )
-        zorder += 1
-        circle = Circle(
-            (
-                involute_dict["rolling_line_inv"][0, 0],
-                involute_dict["rolling_line_inv"][1, 0],
-            ),
-            0.04,
-            color="yellow",
-            alpha=1,
-            zorder=zorder,
-        )
-        zorder += 1
-        ax.add_patch(circle)
-
-    ax.plot(
-        involute_dict["points_inv"][0, :],
-        involute_dict["points_inv"][1, :],
-        color="white",
-        linewidth=lw,
-        zorder=zorder,
+def _involute_frames(
+    phis: np.ndarray, phi_0: float, type: Literal["line", "string"], phi_max: float
+) -> list[np.ndarray]:
+    fig, ax = _agg_axes(dpi=300)
+    animation: InvoluteAnimation = InvoluteAnimation(
+        ax, phi_0, show_arrows=False, show_angle=True, type=type, phi_max=phi_max
     )
-    zorder += 1
-    if show_angle:
-        ax.plot(
-            [r, 0, involute_dict["rolling_line_contact"][0, 0]],
-            [0, 0, involute_dict["rolling_line_contact"][1, 0]],
-            color="white",
-            linewidth=lw / 3,
-            zorder=zorder,
-        )
-        zorder += 1
-        angle = Arc(
-            (0, 0),
-            width=r / 2,
-            height=r / 2,
-            theta1=0.0,
-            theta2=phi,
-            color="white",
-            lw=lw / 3,
-            alpha=1.0,
-            zorder=zorder,
-        )
-        zorder += 1
-        ax.add_patch(angle)
-        mid_angle_deg: float = phi / 2
-        mid_angle_rad: float = np.radians(mid_angle_deg)
-        text_radius: float = r / 2.5
-        x_text: float = text_radius * np.cos(mid_angle_rad)
-        y_text: float = text_radius * np.sin(mid_angle_rad)
-        ax.text(
-            x_text,
-            y_text,
-            r"$\phi$",
-            color="white",
-            fontsize=14,
-            ha="center",
-            va="center",
-            zorder=zorder,
-        )
-        zorder += 1
-
-    if show_arrows:
-        ax = _plot_arrow(
-            ax,
-            x1=0.0,
-            y1=0.0,
-            x2=involute_dict["rolling_line_contact"][0, 0],
-            y2=involute_dict["rolling_line_contact"][1, 0],
-            color="yellow",
-            zorder=zorder,
-        )
-        zorder += 1
-        ax = _plot_arrow(
-            ax,
-            x1=involute_dict["rolling_line_contact"][0, 0],
-            y1=involute_dict["rolling_line_contact"][1, 0],
-            x2=involute_dict["inv_end"][0, 0],
-            y2=involute_dict["inv_end"][1, 0],
-            color="blue",
-            zorder=zorder,
-        )
-        zorder += 1
-
-    ax.set_aspect("equal")
-    ax.set_xlim(-1.5 * r, 3 * r)
-    ax.set_ylim(-1.5 * r, 3 * r)
-    ax = add_background_rect(ax, (-1.5 * r, 3 * r), (-1.5 * r, 3 * r))
-    ax.set_position((0, 0, 1, 1))
-    ax.set_axis_off()
-
-    return ax
+    blit: _BlitFrames = _BlitFrames(fig, animation.artists)
+    frames: list[np.ndarray] = []
+    for phi in phis:
+        animation.update(phi)
+        frames.append(blit.frame())
+    return frames
 
 
 def create_involute_video(
-    output_dir: Path, video_length: float, type: Literal["line", "string"]
+    output_dir: Path,
+    video_length: float,
+    type: Literal["line", "string"],
+    headless: bool = False,
+    max_workers: int | None = None,
+    chunk_size: int = 16,
 ):
-    temp_dir = output_dir / "involute"
-    temp_dir.mkdir(exist_ok=True)
-
+    # headless renders the frames with Agg, in chunks of chunk_size frames
+    # spread over a process pool, instead of in an interactive window
     phi_min: float = -90
     if type == "string":
         phi_min = 0.0
     phi_max: float = 140
     step: float = 1 if phi_max > phi_min else -1
     phi_arr: np.ndarray = np.arange(phi_min, phi_max, step)
+    if len(phi_arr) == 0:
+        raise ValueError("No frames to render")
+
+    # the frames are streamed to ffmpeg as they are drawn
+    framerate = int(len(phi_arr) / video_length)
+    with FrameEncoder(output_dir / "involute.mp4", framerate) as encoder:
+        if headless:
+            _encode_in_pool(
+                _involute_frames,
+                [
+                    (chunk, phi_min, type, phi_arr[-1])
+                    for chunk in _chunks(phi_arr, chunk_size)
+                ],
+                encoder,
+                max_workers,
+            )
+            return
 
-    plt.ion()
-    fig, ax = plt.subplots(figsize=(5, 5))
-    plt.show(block=False)
-
-    for i, phi in enumerate(phi_arr):
-        ax.clear()
-        involute_plot(
-            ax=ax,
-            phi_0=phi_min,
-            phi=phi,
+        plt.ion()
+        fig, ax = plt.subplots(figsize=(5, 5))
+        animation: InvoluteAnimation = InvoluteAnimation(
+            ax,
+            phi_min,
             show_arrows=False,
             show_angle=True,
             type=type,
             phi_max=phi_arr[-1],
         )
-        fig.canvas.draw()
-        fig.canvas.flush_events()
-        plt.pause(0.001)  # Brief pause to update display
-        fig.savefig(temp_dir / f"involute_{i:03d}.png", dpi=300)
+        plt.show(block=False)
 
-    plt.ioff()
-    plt.close(fig)
-
-    frame_files: list[Path] = sorted(temp_dir.glob("involute_*.png"))
-    total_frames: int = len(frame_files)
-    if total_frames == 0:
-        raise ValueError(f"No frames found in {temp_dir}")
-
-    framerate = int(total_frames / video_length)
-    output_path = output_dir / "involute.mp4"
-
-    ffmpeg_video(temp_dir, output_path, "involute", framerate)
+        try:
+            for phi in phi_arr:
+                animation.update(phi)
+                fig.canvas.draw()
+                fig.canvas.flush_events()
+                plt.pause(0.001)  # Brief pause to update display
+                encoder.write(_figure_rgb(fig, dpi=300))
+        finally:
+            plt.ioff()
+            plt.close(fig)
 
 
 def undercut_plot_compute(
@@ -462,218 +594,298 @@ def undercut_plot_compute(
     return result
 
 
-def undercut_plot(
-    ax: Axes,
-    phi_0: float,
-    phi_undercut: float,
-    flank: Literal["left", "right"],
-    show_arrows: bool,
-    show_line: bool,
-    phi_undercut_max: float | None = None,
-) -> Axes:
-    lw: float = 1.0
-
-    zorder: int = 100
-
-    phi_inv: float
-    if flank == "right":
-        phi_inv = 30.0
-    else:
-        phi_inv = -30.0
-
-    undercut_dict: dict = undercut_plot_compute(
-        phi_0, phi_undercut, flank, phi_inv, phi_undercut_max
-    )
-    involute_dict: dict[str, np.ndarray] = undercut_dict["undercut_inv_dict"]
-
-    dedendum_circle = Circle(
-        (0, 0),
-        undercut_dict["df"] / 2,
-        color="gray",
-        alpha=1,
-        fill=False,
-        zorder=zorder,
-    )
-    ax.add_patch(dedendum_circle)
-    zorder += 1
-    pitch_circle = Circle(
-        (0, 0),
-        undercut_dict["dp"] / 2,
-        color="gray",
-        alpha=1,
-        fill=False,
-        zorder=zorder,
-    )
-    ax.add_patch(pitch_circle)
-    zorder += 1
-    base_circle = Circle(
-        (0, 0),
-        undercut_dict["db"] / 2,
-        color="gray",
-        alpha=1,
-        fill=False,
-        zorder=zorder,
-    )
-    ax.add_patch(base_circle)
-    zorder += 1
-
-    ax.plot(
-        undercut_dict["points_inv"][0, :],
-        undercut_dict["points_inv"][1, :],
-        color="white",
-        linewidth=lw,
-        zorder=zorder,
-    )
-    zorder += 1
-
-    ax.plot(
-        involute_dict["points_inv"][0, :],
-        involute_dict["points_inv"][1, :],
-        color="red",
-        linewidth=lw,
-        zorder=zorder,
-    )
-    zorder += 1
+class UndercutAnimation:
+    """
+    Animated undercut_plot that updates its artists instead of rebuilding them.
+
+    The dedendum, pitch and base circles, the reference involute and the
+    background are created once. Every update only sets the data of the
+    rolling involute, the undercut curve, the rolling line and the arrows. A
+    single update gives the same figure as undercut_plot.
+
+    Args:
+        ax: Axes to draw on
+        phi_0: Start angle of the undercut curve in degrees
+        flank: Flank of the tooth space to draw
+        show_arrows: Draw the radius, string and undercut arrows
+        show_line: Draw the rolling line with its contact marker
+        phi_undercut_max: Last phi_undercut of the animation, sets the
+            rolling line length (defaults to that of each update)
+    """
+
+    def __init__(
+        self,
+        ax: Axes,
+        phi_0: float,
+        flank: Literal["left", "right"],
+        show_arrows: bool,
+        show_line: bool,
+        phi_undercut_max: float | None = None,
+    ) -> None:
+        self.ax: Axes = ax
+        self.phi_0: float = phi_0
+        self.flank: Literal["left", "right"] = flank
+        self.phi_undercut_max: float | None = phi_undercut_max
+        lw: float = 1.0
+
+        zorder: int = 100
+
+        self.phi_inv: float
+        if flank == "right":
+            self.phi_inv = 30.0
+        else:
+            self.phi_inv = -30.0
 
-    ax.plot(
-        undercut_dict["points_undercut"][0, :],
-        undercut_dict["points_undercut"][1, :],
-        color="red",
-        linewidth=lw,
-        zorder=zorder,
-    )
-    zorder += 1
+        undercut_dict: dict = undercut_plot_compute(
+            phi_0, phi_0, flank, self.phi_inv, phi_undercut_max
+        )
 
-    if show_line:
-        ax.plot(
-            [
-                involute_dict["rolling_line_inv"][0, 0],
-                involute_dict["rolling_line_start"][0, 0],
-            ],
-            [
-                involute_dict["rolling_line_inv"][1, 0],
-                involute_dict["rolling_line_start"][1, 0],
-            ],
-            color="red",
-            lw=lw,
-            ls="--",
+        dedendum_circle = Circle(
+            (0, 0),
+            undercut_dict["df"] / 2,
+            color="gray",
+            alpha=1,
+            fill=False,
             zorder=zorder,
         )
+        ax.add_patch(dedendum_circle)
         zorder += 1
-        ax.plot(
-            [
-                involute_dict["rolling_line_inv"][0, 0],
-                involute_dict["rolling_line_end"][0, 0],
-            ],
-            [
-                involute_dict["rolling_line_inv"][1, 0],
-                involute_dict["rolling_line_end"][1, 0],
-            ],
-            color="red",
-            lw=lw,
-            ls="--",
+        pitch_circle = Circle(
+            (0, 0),
+            undercut_dict["dp"] / 2,
+            color="gray",
+            alpha=1,
+            fill=False,
             zorder=zorder,
         )
+        ax.add_patch(pitch_circle)
         zorder += 1
-        circle = Circle(
-            (
-                involute_dict["rolling_line_inv"][0, 0],
-                involute_dict["rolling_line_inv"][1, 0],
-            ),
-            0.04,
-            color="yellow",
+        base_circle = Circle(
+            (0, 0),
+            undercut_dict["db"] / 2,
+            color="gray",
             alpha=1,
+            fill=False,
             zorder=zorder,
         )
+        ax.add_patch(base_circle)
         zorder += 1
-        ax.add_patch(circle)
 
-    if show_arrows:
-        ax = _plot_arrow(
-            ax,
-            x1=0.0,
-            y1=0.0,
-            x2=involute_dict["rolling_line_contact"][0, 0],
-            y2=involute_dict["rolling_line_contact"][1, 0],
-            color="yellow",
+        ax.plot(
+            undercut_dict["points_inv"][0, :],
+            undercut_dict["points_inv"][1, :],
+            color="white",
+            linewidth=lw,
             zorder=zorder,
         )
         zorder += 1
-        ax = _plot_arrow(
-            ax,
-            x1=involute_dict["rolling_line_contact"][0, 0],
-            y1=involute_dict["rolling_line_contact"][1, 0],
-            x2=involute_dict["inv_end"][0, 0],
-            y2=involute_dict["inv_end"][1, 0],
-            color="blue",
-            zorder=zorder,
+
+        (self._involute,) = ax.plot(
+            [], [], color="red", linewidth=lw, zorder=zorder
         )
         zorder += 1
-        ax = _plot_arrow(
-            ax,
-            x1=involute_dict["points_inv"][0, -1],
-            y1=involute_dict["points_inv"][1, -1],
-            x2=undercut_dict["points_undercut"][0, -1],
-            y2=undercut_dict["points_undercut"][1, -1],
-            color="orange",
-            zorder=zorder,
+        (self._undercut,) = ax.plot(
+            [], [], color="red", linewidth=lw, zorder=zorder
         )
         zorder += 1
 
-    geardata: core.GearData = undercut_dict["geardata"]
-    ax.set_aspect("equal")
-    xlim: tuple[float, float] = (0.0, 0.6 * geardata.da)
-    ylim: tuple[float, float] = (-0.3 * geardata.da, 0.3 * geardata.da)
-    ax.set_xlim(*xlim)
-    ax.set_ylim(*ylim)
-    ax = add_background_rect(ax, xlim, ylim)
-    ax.set_position((0, 0, 1, 1))
-    ax.set_axis_off()
+        self._line_start: Line2D | None = None
+        self._line_end: Line2D | None = None
+        self._marker: Circle | None = None
+        if show_line:
+            (self._line_start,) = ax.plot(
+                [], [], color="red", lw=lw, ls="--", zorder=zorder
+            )
+            zorder += 1
+            (self._line_end,) = ax.plot(
+                [], [], color="red", lw=lw, ls="--", zorder=zorder
+            )
+            zorder += 1
+            self._marker = Circle((0, 0), 0.04, color="yellow", alpha=1, zorder=zorder)
+            zorder += 1
+            ax.add_patch(self._marker)
 
-    return ax
+        self._radius_arrow: FancyArrow | None = None
+        self._string_arrow: FancyArrow | None = None
+        self._undercut_arrow: FancyArrow | None = None
+        if show_arrows:
+            self._radius_arrow = _add_arrow(ax, "yellow", zorder)
+            zorder += 1
+            self._string_arrow = _add_arrow(ax, "blue", zorder)
+            zorder += 1
+            self._undercut_arrow = _add_arrow(ax, "orange", zorder)
+            zorder += 1
+
+        geardata: core.GearData = undercut_dict["geardata"]
+        ax.set_aspect("equal")
+        xlim: tuple[float, float] = (0.0, 0.6 * geardata.da)
+        ylim: tuple[float, float] = (-0.3 * geardata.da, 0.3 * geardata.da)
+        ax.set_xlim(*xlim)
+        ax.set_ylim(*ylim)
+        add_background_rect(ax, xlim, ylim)
+        ax.set_position((0, 0, 1, 1))
+        ax.set_axis_off()
+
+        # everything that moves, all of it above the static artists
+        self.artists: list[Artist] = [
+            artist
+            for artist in (
+                self._involute,
+                self._undercut,
+                self._line_start,
+                self._line_end,
+                self._marker,
+                self._radius_arrow,
+                self._string_arrow,
+                self._undercut_arrow,
+            )
+            if artist is not None
+        ]
 
+    def update(self, phi_undercut: float) -> list[Artist]:
+        """
+        Move the artists to the rolling angle phi_undercut.
 
-def create_undercut_video(output_dir: Path, video_length: float):
-    temp_dir = output_dir / "undercut"
-    temp_dir.mkdir(exist_ok=True)
+        Args:
+            phi_undercut: Rolling angle in degrees
 
+        Returns:
+            The moving artists, e.g. for blitting
+        """
+        undercut_dict: dict = undercut_plot_compute(
+            self.phi_0, phi_undercut, self.flank, self.phi_inv, self.phi_undercut_max
+        )
+        involute_dict: dict[str, np.ndarray] = undercut_dict["undercut_inv_dict"]
+        points_undercut: np.ndarray = undercut_dict["points_undercut"]
+        contact: np.ndarray = involute_dict["rolling_line_contact"][:, 0]
+        rolling_inv: np.ndarray = involute_dict["rolling_line_inv"][:, 0]
+
+        self._involute.set_data(
+            involute_dict["points_inv"][0, :], involute_dict["points_inv"][1, :]
+        )
+        self._undercut.set_data(points_undercut[0, :], points_undercut[1, :])
+
+        if self._line_start is not None:
+            start: np.ndarray = involute_dict["rolling_line_start"][:, 0]
+            self._line_start.set_data(
+                [rolling_inv[0], start[0]], [rolling_inv[1], start[1]]
+            )
+        if self._line_end is not None:
+            end: np.ndarray = involute_dict["rolling_line_end"][:, 0]
+            self._line_end.set_data(
+                [rolling_inv[0], end[0]], [rolling_inv[1], end[1]]
+            )
+        if self._marker is not None:
+            self._marker.set_center((rolling_inv[0], rolling_inv[1]))
+
+        if self._radius_arrow is not None:
+            _move_arrow(self._radius_arrow, 0.0, 0.0, contact[0], contact[1])
+        if self._string_arrow is not None:
+            inv_end: np.ndarray = involute_dict["inv_end"][:, 0]
+            _move_arrow(
+                self._string_arrow, contact[0], contact[1], inv_end[0], inv_end[1]
+            )
+        if self._undercut_arrow is not None:
+            _move_arrow(
+                self._undercut_arrow,
+                involute_dict["points_inv"][0, -1],
+                involute_dict["points_inv"][1, -1],
+                points_undercut[0, -1],
+                points_undercut[1, -1],
+            )
+
+        return self.artists
+
+
+def undercut_plot(
+    ax: Axes,
+    phi_0: float,
+    phi_undercut: float,
+    flank: Literal["left", "right"],
+    show_arrows: bool,
+    show_line: bool,
+    phi_undercut_max: float | None = None,
+) -> Axes:
+    UndercutAnimation(
+        ax, phi_0, flank, show_arrows, show_line, phi_undercut_max
+    ).update(phi_undercut)
+    return ax
+
+
+def _undercut_frames(
+    phis: np.ndarray,
+    phi_0: float,
+    phi_undercut_max: float,
+    flank: Literal["left", "right"],
+) -> list[np.ndarray]:
+    fig, ax = _agg_axes(dpi=300)
+    animation: UndercutAnimation = UndercutAnimation(
+        ax,
+        phi_0,
+        flank,
+        show_arrows=True,
+        show_line=True,
+        phi_undercut_max=phi_undercut_max,
+    )
+    blit: _BlitFrames = _BlitFrames(fig, animation.artists)
+    frames: list[np.ndarray] = []
+    for phi in phis:
+        animation.update(phi)
+        frames.append(blit.frame())
+    return frames
+
+
+def create_undercut_video(
+    output_dir: Path,
+    video_length: float,
+    headless: bool = False,
+    max_workers: int | None = None,
+    chunk_size: int = 16,
+):
+    # headless renders the frames with Agg, in chunks of chunk_size frames
+    # spread over a process pool, instead of in an interactive window
     phi_min: float = 30
     phi_max: float = -50
     flank: Literal["left", "right"] = "right"
     phi_arr: np.ndarray = np.linspace(phi_min, phi_max, 500)
 
-    plt.ion()
-    fig, ax = plt.subplots(figsize=(5, 5))
-    plt.show(block=False)
+    # the frames are streamed to ffmpeg as they are drawn
+    framerate = int(len(phi_arr) / video_length)
+    with FrameEncoder(output_dir / "undercut.mp4", framerate) as encoder:
+        if headless:
+            _encode_in_pool(
+                _undercut_frames,
+                [
+                    (chunk, phi_min, phi_arr[-1], flank)
+                    for chunk in _chunks(phi_arr, chunk_size)
+                ],
+                encoder,
+                max_workers,
+            )
+            return
 
-    for i, phi in enumerate(phi_arr):
-        ax.clear()
-        undercut_plot(
-            ax=ax,
-            phi_0=phi_min,
-            phi_undercut=phi,
+        plt.ion()
+        fig, ax = plt.subplots(figsize=(5, 5))
+        animation: UndercutAnimation = UndercutAnimation(
+            ax,
+            phi_min,
+            flank,
             show_arrows=True,
             show_line=True,
             phi_undercut_max=phi_arr[-1],
-            flank=flank,
         )
-        fig.canvas.draw()
-        fig.canvas.flush_events()
-        plt.pause(0.001)  # Brief pause to update display
-        fig.savefig(temp_dir / f"undercut_{i:03d}.png", dpi=300)
-
-    plt.ioff()  # Turn off interactive mode
-    plt.close(fig)
-
-    frame_files: list[Path] = sorted(temp_dir.glob("undercut_*.png"))
-    total_frames: int = len(frame_files)
-    if total_frames == 0:
-        raise ValueError(f"No frames found in {temp_dir}")
-
-    framerate = int(total_frames / video_length)
-    output_path = output_dir / "undercut.mp4"
+        plt.show(block=False)
 
-    ffmpeg_video(temp_dir, output_path, "undercut", framerate)
+        try:
+            for phi in phi_arr:
+                animation.update(phi)
+                fig.canvas.draw()
+                fig.canvas.flush_events()
+                plt.pause(0.001)  # Brief pause to update display
+                encoder.write(_figure_rgb(fig, dpi=300))
+        finally:
+            plt.ioff()  # Turn off interactive mode
+            plt.close(fig)
 
 
 def tooth_plot_compute(
@@ -698,7 +910,7 @@ def tooth_plot_compute(
     phi_inv_start: float = geometry.involute_phi_d(dp, db, "right")
     phi_undercut_end: float = geometry.undercut_phi_d(dp, dp, df, alpha_t_r, "right")
     phi_inv_start, phi_undercut_end = geometry.undercut_involute_intersection(
-        phi_inv_start, phi_undercut_end, df, dp, db, alpha_t_r, "right", 200
+        phi_inv_start, phi_undercut_end, df, dp, db, alpha_t_r, "right"
     )
 
     phi_r_end: float
@@ -1,39 +1,166 @@
 import cadquery as cq
 import numpy as np
 
+from .cache import LRUMemo, MemoStats, SolidCache, cache_key
 from .core import GearData
 
+# racks are shared by every group, in this or later calls, with the same rack
+# parameters, e.g. the same gear set rebuilt by nightly jobs
+_rack_memo: LRUMemo = LRUMemo(maxsize=16)
 
-def _create_single_rack_sketch(
+
+def rack_memo_stats() -> MemoStats:
+    return _rack_memo.stats()
+
+
+def clear_rack_memo() -> None:
+    _rack_memo.clear()
+
+
+def _rack_outline_wire(
     m: float,
     z: int,
     ha: float,
     hf: float,
-    alpha_t: float,
     alpha_t_r: float,
     rho_f: float,
     p: float,
-) -> cq.Sketch:
+) -> cq.Wire:
+    # closed outline of the rack, built edge by edge: z + 4 teeth of height
+    # ha + hf, p / 2 wide at the pitch line (y = 0), with root fillets of
+    # radius rho_f, standing on a base 3 m deep
     base_height: float = 3 * m
     rack_length: float = (z + 4) * p
     n_rack_teeth: int = int(rack_length / p)
-    toothwidth_at_base: float = p / 2 + 2 * hf * np.tan(alpha_t_r)
-
-    rack_sketch: cq.Sketch = (
-        cq.Sketch()
-        .push([(0, -base_height / 2 - hf)])
-        .rect(rack_length, base_height)
-        .push([(0, (ha + hf) / 2 - hf)])
-        .rarray(p, 1, n_rack_teeth, 1)
-        .trapezoid(toothwidth_at_base, ha + hf, 90 - alpha_t, mode="a")
-        .clean()
-        .reset()
-        .vertices("not (<Y or >Y or <X or >X)")
-        .fillet(rho_f)
-        .clean()
+    half_base_width: float = p / 4 + hf * np.tan(alpha_t_r)
+    flank_run: float = (ha + hf) * np.tan(alpha_t_r)
+
+    # the fillet meets the root line and the flank (inner angle 90 + alpha)
+    # at the tangent length t from their corner
+    t: float = rho_f / np.tan((np.pi / 2 + alpha_t_r) / 2)
+    if t > p / 2 - half_base_width:
+        raise ValueError(
+            f"rho_f={rho_f} is too large for the tooth space at the rack root"
+        )
+    up_right: np.ndarray = np.array([np.sin(alpha_t_r), np.cos(alpha_t_r)])
+    up_left: np.ndarray = np.array([-np.sin(alpha_t_r), np.cos(alpha_t_r)])
+
+    def vec(point: np.ndarray) -> cq.Vector:
+        return cq.Vector(float(point[0]), float(point[1]), 0.0)
+
+    def fillet(corner: np.ndarray, start: np.ndarray, end: np.ndarray) -> cq.Edge:
+        # the centre lies rho_f above the tangent point on the root line
+        on_root: np.ndarray = start if np.isclose(start[1], -hf) else end
+        centre: np.ndarray = on_root + np.array([0.0, rho_f])
+        towards_corner: np.ndarray = corner - centre
+        mid: np.ndarray = centre + rho_f * towards_corner / np.linalg.norm(
+            towards_corner
+        )
+        return cq.Edge.makeThreePointArc(vec(start), vec(mid), vec(end))
+
+    edges: list[cq.Edge] = []
+    root_start: np.ndarray = np.array([-rack_length / 2, -hf])
+    for i in range(n_rack_teeth):
+        centre_x: float = (i - (n_rack_teeth - 1) / 2) * p
+        left_corner: np.ndarray = np.array([centre_x - half_base_width, -hf])
+        right_corner: np.ndarray = np.array([centre_x + half_base_width, -hf])
+        left_root: np.ndarray = left_corner - np.array([t, 0.0])
+        left_flank: np.ndarray = left_corner + t * up_right
+        left_tip: np.ndarray = np.array([left_corner[0] + flank_run, ha])
+        right_tip: np.ndarray = np.array([right_corner[0] - flank_run, ha])
+        right_flank: np.ndarray = right_corner + t * up_left
+        right_root: np.ndarray = right_corner + np.array([t, 0.0])
+
+        if left_root[0] - root_start[0] > 1e-9 * p:
+            edges.append(cq.Edge.makeLine(vec(root_start), vec(left_root)))
+        edges.extend(
+            [
+                fillet(left_corner, left_root, left_flank),
+                cq.Edge.makeLine(vec(left_flank), vec(left_tip)),
+                cq.Edge.makeLine(vec(left_tip), vec(right_tip)),
+                cq.Edge.makeLine(vec(right_tip), vec(right_flank)),
+                fillet(right_corner, right_flank, right_root),
+            ]
+        )
+        root_start = right_root
+
+    corners: list[np.ndarray] = [
+        np.array([rack_length / 2, -hf]),
+        np.array([rack_length / 2, -hf - base_height]),
+        np.array([-rack_length / 2, -hf - base_height]),
+        np.array([-rack_length / 2, -hf]),
+    ]
+    for corner in corners:
+        edges.append(cq.Edge.makeLine(vec(root_start), vec(corner)))
+        root_start = corner
+
+    return cq.Wire.assembleEdges(edges)
+
+
+def _create_single_rack_sketch(
+    m: float,
+    z: int,
+    ha: float,
+    hf: float,
+    alpha_t: float,
+    alpha_t_r: float,
+    rho_f: float,
+    p: float,
+) -> cq.Sketch:
+    # alpha_t (in degrees) is kept for the callers; the outline uses alpha_t_r
+    outline: cq.Wire = _rack_outline_wire(m, z, ha, hf, alpha_t_r, rho_f, p)
+    return cq.Sketch().face(cq.Face.makeFromWires(outline))
+
+
+def rack_period_segments(
+    geardata: GearData, n_arc_points: int = 64
+) -> tuple[np.ndarray, np.ndarray]:
+    # start and end points, each of shape (2, M), of the straight segments
+    # approximating one pitch of the rack outline. The rack is shifted so that
+    # a tooth gap, which cuts a gear tooth, is centred on x = 0; the pitch
+    # covers x in [-p/2, p/2] and the tooth tip straddling p/2 appears at both
+    # ends. The outline of the shortest rack (z = 1, five teeth) suffices.
+    face: cq.Face = cq.Face.makeFromWires(
+        _rack_outline_wire(
+            geardata.m_t,
+            1,
+            geardata.ha,
+            geardata.hf,
+            geardata.alpha_t_r,
+            geardata.rho_f,
+            geardata.p,
+        )
     )
+    bb: cq.BoundBox = face.BoundingBox()
+    tol: float = 1e-6 * geardata.m_t
+
+    starts: list[np.ndarray] = []
+    ends: list[np.ndarray] = []
+    gap_centres: list[float] = []
+    for edge in face.outerWire().Edges():
+        n: int = 2 if edge.geomType() == "LINE" else n_arc_points
+        points: np.ndarray = np.array(
+            [[v.x, v.y] for v in edge.positions(np.linspace(0.0, 1.0, n))]
+        ).T
+        # only the toothed upper boundary of the rack cuts the gear
+        if np.any(points[1] < bb.ymin + tol) or np.all(
+            np.abs(np.abs(points[0]) - bb.xlen / 2) < tol
+        ):
+            continue
+        if np.all(np.abs(points[1] + geardata.hf) < tol):
+            gap_centres.append(float(points[0].mean()))
+        starts.append(points[:, :-1])
+        ends.append(points[:, 1:])
+
+    start: np.ndarray = np.hstack(starts)
+    end: np.ndarray = np.hstack(ends)
+    gap_centre: float = min(gap_centres, key=abs)
+    start[0] -= gap_centre
+    end[0] -= gap_centre
 
-    return rack_sketch
+    mid_x: np.ndarray = (start[0] + end[0]) / 2
+    in_period: np.ndarray = np.abs(mid_x) <= geardata.p / 2 + tol
+    return start[:, in_period], end[:, in_period]
 
 
 def _create_single_rack_cutter(
@@ -82,6 +209,7 @@ def _create_single_rack_cutter(
 def create_rack_cutter_for_group(
     gear_data_list: list[GearData],
     group: set[int],
+    cache: SolidCache | None = None,
 ) -> cq.Workplane:
     gear_data_in_group: list[GearData] = [gear_data_list[i] for i in group]
 
@@ -89,16 +217,46 @@ def create_rack_cutter_for_group(
     z_max: int = max(gd.z for gd in gear_data_in_group)
     b_max: float = max(gd.b for gd in gear_data_in_group)
 
-    return _create_single_rack_cutter(
-        first.m_t,
-        z_max,
-        b_max,
-        first.alpha_t,
-        first.alpha_t_r,
-        first.beta_r,
-        first.ha,
-        first.hf,
-        first.rho_f,
-        first.p,
-        first.delta_r,
-    )
+    # everything the rack solid depends on; z_max sets its length and b_max
+    # its width
+    params: dict[str, float | int] = {
+        "m_t": float(first.m_t),
+        "alpha_t": float(first.alpha_t),
+        "beta_r": float(first.beta_r),
+        "ha": float(first.ha),
+        "hf": float(first.hf),
+        "rho_f": float(first.rho_f),
+        "delta_r": float(first.delta_r),
+        "z_max": int(z_max),
+        "b_max": float(b_max),
+    }
+
+    key: str | None = None
+    if cache is not None:
+        key = cache_key("rack_cutter", **params)
+
+    def build() -> cq.Workplane:
+        if cache is not None and key is not None:
+            cached: cq.Workplane | None = cache.get(key)
+            if cached is not None:
+                return cached
+
+        return _create_single_rack_cutter(
+            first.m_t,
+            z_max,
+            b_max,
+            first.alpha_t,
+            first.alpha_t_r,
+            first.beta_r,
+            first.ha,
+            first.hf,
+            first.rho_f,
+            first.p,
+            first.delta_r,
+        )
+
+    rack: cq.Workplane = _rack_memo.get_or_compute(tuple(params.values()), build)
+    # the memo may hold racks built without this cache, they are stored too
+    if cache is not None and key is not None and key not in cache:
+        cache.put(key, rack)
+    return rack
@@ -0,0 +1,136 @@
+import numpy as np
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import IO
+
+
+class FrameEncoder:
+    """
+    Encode frames into an MP4 video by streaming raw RGB data to ffmpeg.
+
+    ffmpeg is started with the first frame, whose size all later frames must
+    share, and reads the frames from its stdin as they are produced. No frame
+    is written to disk. Odd frame sizes are padded by scaling to even ones,
+    as yuv420p requires.
+
+    Args:
+        output_path: Path where the MP4 video will be saved
+        framerate: Frames per second of the video
+        crf: x264 constant rate factor (lower is better quality)
+    """
+
+    def __init__(self, output_path: Path, framerate: float, crf: int = 23) -> None:
+        self.output_path: Path = output_path
+        self.framerate: float = framerate
+        self.crf: int = crf
+        self.n_frames: int = 0
+        self._shape: tuple[int, ...] | None = None
+        self._process: subprocess.Popen | None = None
+        # ffmpeg logs to a file, a pipe nobody reads could fill up and block it
+        self._log: IO[bytes] | None = None
+
+    def _start(self, width: int, height: int) -> None:
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._log = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            [
+                "ffmpeg",
+                "-y",
+                "-loglevel",
+                "error",
+                "-f",
+                "rawvideo",
+                "-pix_fmt",
+                "rgb24",
+                "-s",
+                f"{width}x{height}",
+                "-framerate",
+                str(self.framerate),
+                "-i",
+                "-",
+                "-vf",
+                "scale=ceil(iw/2)*2:ceil(ih/2)*2",
+                "-c:v",
+                "libx264",
+                "-profile:v",
+                "baseline",
+                "-level",
+                "3.0",
+                "-pix_fmt",
+                "yuv420p",
+                "-preset",
+                "medium",
+                "-crf",
+                str(self.crf),
+                str(self.output_path),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=self._log,
+        )
+
+    def write(self, frame: np.ndarray) -> None:
+        """
+        Append one frame to the video.
+
+        Args:
+            frame: Image of shape (height, width, 3) or (height, width, 4); an
+                alpha channel is dropped. Float images are taken to lie in
+                [0, 1].
+        """
+        if frame.ndim != 3 or frame.shape[2] not in (3, 4):
+            raise ValueError(
+                f"Expected a (height, width, 3 or 4) image, got shape {frame.shape}"
+            )
+        if frame.dtype != np.uint8:
+            frame = np.clip(np.round(frame * 255), 0, 255).astype(np.uint8)
+        rgb: np.ndarray = np.ascontiguousarray(frame[:, :, :3])
+
+        if self._process is None:
+            self._shape = rgb.shape
+            self._start(rgb.shape[1], rgb.shape[0])
+        elif rgb.shape != self._shape:
+            raise ValueError(
+                f"Frame {self.n_frames} has shape {rgb.shape}, "
+                f"the first frame had {self._shape}"
+            )
+
+        try:
+            self._process.stdin.write(rgb.tobytes())  # type: ignore
+        except BrokenPipeError:
+            # ffmpeg exited early, close() raises with its error output
+            self.close()
+            raise RuntimeError(f"ffmpeg stopped reading frames for {self.output_path}")
+        self.n_frames += 1
+
+    def close(self) -> None:
+        """
+        Finish the video and wait for ffmpeg.
+
+        Raises:
+            RuntimeError: If ffmpeg failed, with its error output
+        """
+        if self._process is None:
+            return
+        process: subprocess.Popen = self._process
+        self._process = None
+        try:
+            process.stdin.close()  # type: ignore
+        except BrokenPipeError:
+            pass
+        returncode: int = process.wait()
+        self._log.seek(0)  # type: ignore
+        message: str = self._log.read().decode(errors="replace")  # type: ignore
+        self._log.close()  # type: ignore
+        if returncode != 0:
+            raise RuntimeError(
+                f"ffmpeg failed to encode {self.output_path} "
+                f"(exit code {returncode}):\n{message}"
+            )
+
+    def __enter__(self) -> "FrameEncoder":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -1,10 +1,161 @@
 import cadquery as cq
 from cadquery import exporters
 from cadquery.vis import show
+import numpy as np
 import pyvista as pv
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 import subprocess
 from typing import Literal
+from OCP.BRepMesh import BRepMesh_IncrementalMesh
+from OCP.gp import gp_Trsf
+from OCP.IVtkOCC import IVtkOCC_Shape, IVtkOCC_ShapeMesher
+from OCP.IVtkVTK import IVtkVTK_ShapeData
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+from .parallel import default_workers
+from .video import FrameEncoder
+
+
+def _prepare_mesh(mesh: pv.PolyData) -> pv.PolyData:
+    # meshes with point normals were prepared before (see RigidMesh)
+    if mesh.point_data.active_normals is not None:
+        return mesh
+    mesh = mesh.clean(tolerance=1e-6)
+    mesh = mesh.triangulate()
+    return mesh.compute_normals(
+        cell_normals=False,
+        point_normals=True,
+        split_vertices=True,
+        feature_angle=30,
+        flip_normals=False,
+        auto_orient_normals=True,
+    )
+
+
+class FrameRenderer:
+    """
+    Long-lived off-screen renderer for hobbing frames.
+
+    The plotter, background, lights, anti-aliasing and camera are set up once.
+    Every frame only swaps the meshes of the gear and rack actors and takes a
+    screenshot, instead of creating and tearing down a VTK context per frame.
+
+    Args:
+        window_size: Tuple of (width, height) for the output images
+        camera_position: Fixed camera position, or None to frame the first
+            rendered frame in an isometric view
+    """
+
+    def __init__(
+        self,
+        window_size: tuple[int, int] = (1920, 1080),
+        camera_position: pv.CameraPosition | None = None,
+    ) -> None:
+        self.window_size: tuple[int, int] = window_size
+        self.camera_position: pv.CameraPosition | None = camera_position
+        self.plotter = pv.Plotter(off_screen=True, window_size=list(window_size))
+        self.plotter.set_background("#E8E8E8")  # type: ignore
+        self.plotter.add_light(
+            pv.Light(position=(100, 100, 150), light_type="scene light", intensity=0.5)
+        )
+        self.plotter.add_light(
+            pv.Light(position=(-80, -80, 100), light_type="scene light", intensity=0.4)
+        )
+        self.plotter.add_light(
+            pv.Light(position=(0, -100, 80), light_type="scene light", intensity=0.3)
+        )
+        self.plotter.add_light(
+            pv.Light(position=(0, 100, -50), light_type="scene light", intensity=0.2)
+        )
+        self.plotter.enable_anti_aliasing("fxaa")
+        self._gear_actor: pv.Actor | None = None
+        self._rack_actor: pv.Actor | None = None
+
+    def _update_actor(
+        self, actor: pv.Actor | None, mesh: pv.PolyData | None, color: str
+    ) -> pv.Actor | None:
+        # the actor is created once and later frames only swap its mapper
+        # input; the prepared meshes carry their point normals, so the smooth
+        # shading filter add_mesh puts in front of the mapper is not needed
+        if mesh is None:
+            if actor is not None:
+                self.plotter.remove_actor(actor, render=False)
+            return None
+        if actor is not None:
+            actor.mapper.dataset = mesh
+            return actor
+        return self.plotter.add_mesh(
+            mesh,
+            color=color,
+            smooth_shading=True,
+            ambient=0.4,
+            diffuse=0.6,
+            specular=0.2,
+            specular_power=15,
+            render=False,
+        )
+
+    def render(
+        self,
+        gear_mesh: pv.PolyData,
+        rack_mesh: pv.PolyData | None,
+        image_path: Path | None = None,
+    ) -> np.ndarray:
+        """
+        Render one frame, optionally to a PNG file.
+
+        Args:
+            gear_mesh: Tessellated gear
+            rack_mesh: Optional tessellated rack
+            image_path: Path of the output PNG file, None to only return the
+                image
+
+        Returns:
+            RGB image of shape (height, width, 3)
+        """
+        self._gear_actor = self._update_actor(
+            self._gear_actor, _prepare_mesh(gear_mesh), "#5D6E7A"
+        )
+        self._rack_actor = self._update_actor(
+            self._rack_actor,
+            None if rack_mesh is None else _prepare_mesh(rack_mesh),
+            "#B89650",
+        )
+
+        if self.camera_position is not None:
+            self.plotter.camera_position = self.camera_position
+        else:
+            self.plotter.camera_position = "iso"
+            self.plotter.camera.zoom(1.3)
+            self.camera_position = self.plotter.camera_position
+        # the near and far planes must enclose this frame's meshes, not the
+        # first frame's; screenshot reuses the last render unless asked
+        self.plotter.reset_camera_clipping_range()
+        self.plotter.render()
+
+        return self.plotter.screenshot(
+            None if image_path is None else str(image_path),
+            transparent_background=False,
+            return_img=True,
+        )
+
+    def close(self) -> None:
+        self.plotter.close()
+
+
+def _render_meshes(
+    gear_mesh: pv.PolyData,
+    rack_mesh: pv.PolyData | None,
+    image_path: Path | None,
+    window_size: tuple[int, int],
+    camera_position: pv.CameraPosition | None,
+) -> np.ndarray:
+    renderer: FrameRenderer = FrameRenderer(window_size, camera_position)
+    image: np.ndarray = renderer.render(gear_mesh, rack_mesh, image_path)
+    renderer.close()
+    return image
 
 
 def render_to_image(
@@ -23,90 +174,273 @@ def render_to_image(
         gear: The gear workplane to render
         rack: Optional rack workplane to render alongside gear
         image_dir: Directory where PNG image will be saved
-        tmp_dir: Directory for temporary files
+        tmp_dir: Directory for temporary files (meshes are no longer written)
         filename: Name of the output PNG file
         window_size: Tuple of (width, height) for the output image
         camera_position: Fixed camera position for consistent framing
     """
-    temp_gear_stl: Path = tmp_dir / "temp_gear.stl"
-    exporters.export(gear, str(temp_gear_stl), tolerance=0.01, angularTolerance=0.1)
+    _render_meshes(
+        to_polydata(gear),
+        None if rack is None else to_polydata(rack),
+        image_dir / filename,
+        window_size,
+        camera_position,
+    )
 
-    plotter = pv.Plotter(off_screen=True, window_size=list(window_size))
-    plotter.set_background("#E8E8E8")  # type: ignore
 
-    gear_mesh = pv.read(str(temp_gear_stl))
-    gear_mesh = gear_mesh.clean(tolerance=1e-6)
-    gear_mesh = gear_mesh.triangulate()
-    gear_mesh = gear_mesh.compute_normals(
-        cell_normals=False,
-        point_normals=True,
-        split_vertices=True,
-        feature_angle=30,
-        flip_normals=False,
-        auto_orient_normals=True,
-    )
+# vertices (V, 3) and triangles (T, 3) of a tessellated shape, followed by the
+# point normals (V, 3) once the mesh is prepared for rendering (see RigidMesh)
+MeshArrays = tuple[np.ndarray, ...]
 
-    plotter.add_mesh(
-        gear_mesh,
-        color="#5D6E7A",
-        smooth_shading=True,
-        ambient=0.4,
-        diffuse=0.6,
-        specular=0.2,
-        specular_power=15,
-    )
 
-    if rack is not None:
-        temp_rack_stl: Path = tmp_dir / "temp_rack.stl"
-        exporters.export(rack, str(temp_rack_stl), tolerance=0.01, angularTolerance=0.1)
-
-        rack_mesh = pv.read(str(temp_rack_stl))
-        rack_mesh = rack_mesh.clean(tolerance=1e-6)
-        rack_mesh = rack_mesh.triangulate()
-        rack_mesh = rack_mesh.compute_normals(
-            cell_normals=False,
-            point_normals=True,
-            split_vertices=True,
-            feature_angle=30,
-            flip_normals=False,
-            auto_orient_normals=True,
+def _trsf_matrix(trsf: gp_Trsf) -> np.ndarray:
+    # upper (3, 4) rows of the homogeneous matrix of trsf
+    return np.array([[trsf.Value(r, c) for c in range(1, 5)] for r in range(1, 4)])
+
+
+def tessellate(workplane: cq.Workplane) -> MeshArrays:
+    """
+    Tessellate all shapes of a workplane in memory.
+
+    Meshes with the same tolerances as the STL export used before. The
+    triangulation is converted to VTK arrays in C++ and read into NumPy
+    arrays in bulk.
+
+    Args:
+        workplane: Workplane holding the shapes to tessellate
+
+    Returns:
+        Tuple of (vertices, triangles) with shapes (V, 3) and (T, 3)
+    """
+    vertices: list[np.ndarray] = []
+    triangles: list[np.ndarray] = []
+    n_vertices: int = 0
+    for shape in workplane.vals():
+        if not isinstance(shape, cq.Shape):
+            continue
+        BRepMesh_IncrementalMesh(shape.wrapped, 0.01, True, 0.1, True)
+        # reuse the triangulation above instead of meshing with the default
+        # deflection of IVtk, and skip the iso lines it draws on every face
+        vtk_shape: IVtkOCC_Shape = IVtkOCC_Shape(shape.wrapped)
+        vtk_shape.Attributes().SetAutoTriangulation(False)
+        vtk_shape.Attributes().UIsoAspect().SetNumber(0)
+        vtk_shape.Attributes().VIsoAspect().SetNumber(0)
+        shape_data: IVtkVTK_ShapeData = IVtkVTK_ShapeData()
+        # the nodes are stored as float by default
+        shape_data.getVtkPolyData().GetPoints().SetDataTypeToDouble()
+        IVtkOCC_ShapeMesher().Build(vtk_shape, shape_data)
+        polydata = shape_data.getVtkPolyData()
+        connectivity: np.ndarray = vtk_to_numpy(
+            polydata.GetPolys().GetConnectivityArray()
         )
+        if len(connectivity) == 0:
+            continue
+        points: np.ndarray = vtk_to_numpy(polydata.GetPoints().GetData())
+        # the points of edges and vertices are not used by any triangle
+        used: np.ndarray = np.zeros(len(points), dtype=bool)
+        used[connectivity] = True
+        index: np.ndarray = np.cumsum(used) - 1
+        vertices.append(points[used])
+        triangles.append(index[connectivity].reshape(-1, 3) + n_vertices)
+        n_vertices += int(used.sum())
+
+    if len(vertices) == 0:
+        return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64)
+    return np.vstack(vertices), np.vstack(triangles).astype(np.int64)
+
+
+class RigidMesh:
+    """
+    Tessellation of a rigid shape that is only moved between frames.
 
-        plotter.add_mesh(
-            rack_mesh,
-            color="#B89650",
-            smooth_shading=True,
-            ambient=0.4,
-            diffuse=0.6,
-            specular=0.2,
-            specular_power=15,
+    The shape (e.g. the rack cutter of a group) is tessellated and prepared
+    for rendering (merged points, split point normals) once; every placement
+    only transforms the cached vertices and normals, which gives the same mesh
+    as preparing the placed copy.
+
+    Args:
+        workplane: Workplane holding the unplaced shapes
+    """
+
+    def __init__(self, workplane: cq.Workplane) -> None:
+        prepared: pv.PolyData = _prepare_mesh(to_polydata(workplane))
+        self.vertices: np.ndarray = np.asarray(prepared.points)
+        self.triangles: np.ndarray = prepared.faces.reshape(-1, 4)[:, 1:]
+        self.normals: np.ndarray = np.asarray(prepared.point_data.active_normals)
+
+    def placed(self, trsf: gp_Trsf) -> MeshArrays:
+        """
+        Mesh of the shape moved by trsf.
+
+        Args:
+            trsf: Rigid transform of the frame, as used to place the shape
+
+        Returns:
+            Tuple of (vertices, triangles, normals); triangles are shared, not
+            copied
+        """
+        matrix: np.ndarray = _trsf_matrix(trsf)
+        rotation: np.ndarray = matrix[:, :3]
+        return (
+            self.vertices @ rotation.T + matrix[:, 3],
+            self.triangles,
+            self.normals @ rotation.T,
         )
-        temp_rack_stl.unlink()
 
-    plotter.add_light(
-        pv.Light(position=(100, 100, 150), light_type="scene light", intensity=0.5)
-    )
-    plotter.add_light(
-        pv.Light(position=(-80, -80, 100), light_type="scene light", intensity=0.4)
-    )
-    plotter.add_light(
-        pv.Light(position=(0, -100, 80), light_type="scene light", intensity=0.3)
+
+def to_polydata(workplane: cq.Workplane) -> pv.PolyData:
+    """
+    Tessellate a workplane into a PyVista mesh without temporary files.
+
+    Args:
+        workplane: Workplane holding the shapes to tessellate
+
+    Returns:
+        Triangle mesh of all shapes
+    """
+    return _polydata(tessellate(workplane))
+
+
+def _polydata(mesh: MeshArrays) -> pv.PolyData:
+    vertices, triangles = mesh[:2]
+    faces: np.ndarray = np.hstack(
+        [np.full((len(triangles), 1), 3, dtype=np.int64), triangles]
     )
-    plotter.add_light(
-        pv.Light(position=(0, 100, -50), light_type="scene light", intensity=0.2)
+    polydata: pv.PolyData = pv.PolyData(vertices, faces.ravel())
+    if len(mesh) > 2:
+        polydata.point_data.active_normals = mesh[2]
+    return polydata
+
+
+# renderer of a RenderQueue worker process, kept for all frames with the same
+# window size and camera
+_worker_renderer: FrameRenderer | None = None
+
+
+def _render_job(
+    gear_mesh: MeshArrays,
+    rack_mesh: MeshArrays | None,
+    image_path: Path | None,
+    window_size: tuple[int, int],
+    camera_position: pv.CameraPosition | None,
+) -> np.ndarray | None:
+    # the image is only sent back when it is not saved as a file
+    global _worker_renderer
+    if (
+        _worker_renderer is None
+        or _worker_renderer.window_size != window_size
+        or camera_position is None
+        or _worker_renderer.camera_position != camera_position
+    ):
+        if _worker_renderer is not None:
+            _worker_renderer.close()
+        _worker_renderer = FrameRenderer(window_size, camera_position)
+    image: np.ndarray = _worker_renderer.render(
+        _polydata(gear_mesh),
+        None if rack_mesh is None else _polydata(rack_mesh),
+        image_path,
     )
+    return image if image_path is None else None
 
-    if camera_position is not None:
-        plotter.camera_position = camera_position
-    else:
-        plotter.camera_position = "iso"
-        plotter.camera.zoom(1.3)
 
-    plotter.enable_anti_aliasing("fxaa")
+class RenderQueue:
+    """
+    Render hobbing frames asynchronously in a process pool.
+
+    The caller tessellates each frame (OCC shapes cannot be sent to other
+    processes) and the workers build the meshes and take the screenshots, so
+    cutting and rendering overlap. At most two frames per worker are in flight;
+    submitting more waits for the oldest one. Frames bound for a video come
+    back as images and reach their encoder in submission order.
+
+    Args:
+        max_workers: Number of render processes, defaults to the number of CPUs
+        window_size: Tuple of (width, height) for the output images
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        window_size: tuple[int, int] = (1920, 1080),
+    ) -> None:
+        self.window_size: tuple[int, int] = window_size
+        n_workers: int = max_workers or default_workers()
+        self._executor: ProcessPoolExecutor = ProcessPoolExecutor(n_workers)
+        # start the workers now, before the caller sets up its own renderer
+        self._executor.submit(int).result()
+        self._max_pending: int = 2 * n_workers
+        self._pending: deque[tuple[Future, Path, FrameEncoder | None]] = deque()
+
+    def submit(
+        self,
+        gear: cq.Workplane,
+        rack: cq.Workplane | None,
+        image_path: Path,
+        camera_position: pv.CameraPosition | None = None,
+        rack_mesh: MeshArrays | None = None,
+        encoder: FrameEncoder | None = None,
+    ) -> None:
+        """
+        Queue one frame for rendering.
+
+        Args:
+            gear: The gear workplane to render
+            rack: Optional rack workplane to render alongside gear
+            image_path: Path of the output PNG file, unused with encoder
+            camera_position: Fixed camera position for consistent framing
+            rack_mesh: Already tessellated rack, used instead of rack
+            encoder: If given, the frame is appended to this video instead of
+                being saved as a PNG file
+        """
+        while len(self._pending) >= self._max_pending:
+            self._wait_oldest()
+        if rack_mesh is None and rack is not None:
+            rack_mesh = tessellate(rack)
+        future: Future = self._executor.submit(
+            _render_job,
+            tessellate(gear),
+            rack_mesh,
+            None if encoder is not None else image_path,
+            self.window_size,
+            camera_position,
+        )
+        self._pending.append((future, image_path, encoder))
+
+    def _wait_oldest(self) -> None:
+        future, image_path, encoder = self._pending.popleft()
+        image: np.ndarray | None = future.result()
+        if encoder is not None:
+            encoder.write(image)  # type: ignore
+            print(f"Encoded: frame {encoder.n_frames} of {encoder.output_path}")
+        else:
+            print(f"Saved: {image_path.name}")
+
+    def flush(self) -> None:
+        """
+        Wait for all queued frames, e.g. before closing their encoder.
+        """
+        while self._pending:
+            self._wait_oldest()
+
+    def close(self) -> None:
+        """
+        Wait for all queued frames and shut the pool down.
+
+        Raises the error of the first frame that failed to render.
+        """
+        try:
+            self.flush()
+        finally:
+            for future, _, _ in self._pending:
+                future.cancel()
+            self._pending.clear()
+            self._executor.shutdown()
+
+    def __enter__(self) -> "RenderQueue":
+        return self
 
-    plotter.screenshot(str(image_dir / filename), transparent_background=False)
-    plotter.close()
-    temp_gear_stl.unlink()
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
 
 def setup_visualization(
@@ -115,9 +449,10 @@ def setup_visualization(
     image_dir: Path,
     tmp_dir: Path,
     gear_blank: cq.Workplane | None = None,
-) -> pv.CameraPosition | None:
+    clean: bool = True,
+) -> "FrameRenderer | None":
     """
-    Setup directories and camera position for visualization.
+    Setup directories and the renderer for visualization.
 
     Args:
         visualize: Visualization mode
@@ -125,18 +460,21 @@ def setup_visualization(
         image_dir: Directory for image files
         tmp_dir: Directory for temporary files
         gear_blank: Gear blank workplane for camera setup (required for img mode)
+        clean: If False, keep existing files (used when resuming a run)
 
     Returns:
-        Fixed camera position for img mode, None otherwise
+        Renderer with the fixed camera position for img mode, None otherwise.
+        The caller closes it after the last frame.
     """
     if visualize == "step":
         step_dir.mkdir(parents=True, exist_ok=True)
-        for file in step_dir.iterdir():
-            if file.name != ".gitignore":
-                try:
-                    file.unlink()
-                except OSError as e:
-                    print(f"Warning: Could not delete {file}: {e}")
+        if clean:
+            for file in step_dir.iterdir():
+                if file.name != ".gitignore":
+                    try:
+                        file.unlink()
+                    except OSError as e:
+                        print(f"Warning: Could not delete {file}: {e}")
         return None
 
     elif visualize == "img":
@@ -144,12 +482,13 @@ def setup_visualization(
         tmp_dir.mkdir(parents=True, exist_ok=True)
 
         # Clean directories except .gitignore
-        for file in image_dir.iterdir():
-            if file.name != ".gitignore":
-                try:
-                    file.unlink()
-                except OSError as e:
-                    print(f"Warning: Could not delete {file}: {e}")
+        if clean:
+            for file in image_dir.iterdir():
+                if file.name != ".gitignore":
+                    try:
+                        file.unlink()
+                    except OSError as e:
+                        print(f"Warning: Could not delete {file}: {e}")
         for file in tmp_dir.iterdir():
             if file.name != ".gitignore":
                 try:
@@ -160,18 +499,14 @@ def setup_visualization(
         if gear_blank is None:
             raise ValueError("gear_blank required for img visualization mode")
 
-        temp_stl: Path = tmp_dir / "temp_setup.stl"
-        exporters.export(gear_blank, str(temp_stl))
         plotter = pv.Plotter(off_screen=True)
-        mesh = pv.read(str(temp_stl))
-        plotter.add_mesh(mesh)  # type: ignore
+        plotter.add_mesh(to_polydata(gear_blank))  # type: ignore
         plotter.camera_position = "iso"
         plotter.camera.zoom(1.2)
         fixed_camera_position = plotter.camera_position
         plotter.close()
-        temp_stl.unlink()
 
-        return fixed_camera_position
+        return FrameRenderer(camera_position=fixed_camera_position)
 
     return None
 
@@ -185,6 +520,10 @@ def visualize_step(
     image_dir: Path,
     tmp_dir: Path,
     camera_position: pv.CameraPosition | None = None,
+    render_queue: RenderQueue | None = None,
+    renderer: FrameRenderer | None = None,
+    rack_mesh: MeshArrays | None = None,
+    encoder: FrameEncoder | None = None,
 ) -> int:
     """
     Visualize a single step of the gear cutting process.
@@ -198,6 +537,12 @@ def visualize_step(
         image_dir: Directory for image files
         tmp_dir: Directory for temporary files
         camera_position: Fixed camera position for img mode
+        render_queue: If given, img frames are rendered asynchronously by it
+        renderer: Persistent renderer from setup_visualization for img frames
+        rack_mesh: Placed rack mesh (see RigidMesh), used for img frames
+            instead of tessellating rack
+        encoder: If given, img frames are appended to this video instead of
+            being saved as PNG files
 
     Returns:
         Updated counter value
@@ -226,15 +571,34 @@ def visualize_step(
 
     elif visualize == "img":
         name: str = f"frame_{counter:05d}.png"
-        render_to_image(
-            result,
-            rack,
-            image_dir,
-            tmp_dir,
-            name,
-            camera_position=camera_position,
+        if render_queue is not None:
+            render_queue.submit(
+                result, rack, image_dir / name, camera_position, rack_mesh, encoder
+            )
+            return counter + 1
+        if rack_mesh is None and rack is not None:
+            rack_mesh = tessellate(rack)
+        gear_polydata: pv.PolyData = to_polydata(result)
+        rack_polydata: pv.PolyData | None = (
+            None if rack_mesh is None else _polydata(rack_mesh)
         )
-        print(f"Saved: {name}")
+        image_path: Path | None = None if encoder is not None else image_dir / name
+        image: np.ndarray
+        if renderer is not None:
+            image = renderer.render(gear_polydata, rack_polydata, image_path)
+        else:
+            image = _render_meshes(
+                gear_polydata,
+                rack_polydata,
+                image_path,
+                (1920, 1080),
+                camera_position,
+            )
+        if encoder is not None:
+            encoder.write(image)
+            print(f"Encoded: frame {encoder.n_frames} of {encoder.output_path}")
+        else:
+            print(f"Saved: {name}")
         return counter + 1
 
     return counter
@@ -38,7 +38,7 @@ print("Saved involute_line.png")
 
 print("[2/6] Generating involute_line.mp4...")
 cq_gears.plotting.create_involute_video(
-    output_dir=output_dir, video_length=10, type="line"
+    output_dir=output_dir, video_length=10, type="line", headless=True
 )
 shutil.move(output_dir / "involute.mp4", output_dir / "involute_line.mp4")
 print("Saved involute_line.mp4")
@@ -55,7 +55,7 @@ print("Saved involute_string.png")
 
 print("[4/6] Generating involute_string.mp4...")
 cq_gears.plotting.create_involute_video(
-    output_dir=output_dir, video_length=10, type="string"
+    output_dir=output_dir, video_length=10, type="string", headless=True
 )
 shutil.move(output_dir / "involute.mp4", output_dir / "involute_string.mp4")
 print("Saved involute_string.mp4")
@@ -71,7 +71,9 @@ plt.close(fig)
 print("Saved hypotroichoid.png")
 
 print("[6/6] Generating hypotroichoid.mp4...")
-cq_gears.plotting.create_undercut_video(output_dir=output_dir, video_length=10)
+cq_gears.plotting.create_undercut_video(
+    output_dir=output_dir, video_length=10, headless=True
+)
 shutil.move(output_dir / "undercut.mp4", output_dir / "hypotroichoid.mp4")
 print("Saved hypotroichoid.mp4")
 